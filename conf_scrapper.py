@@ -1,158 +1,250 @@
 import sqlite3
+import asyncio
+import queue
+import threading
 import time
 import re
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+import sys
+import gzip
+import multiprocessing
+import multiprocessing.util
+from operator import itemgetter
+import aiohttp
+from aiolimiter import AsyncLimiter
+from selectolax.parser import HTMLParser
+from lxml import etree
 import logging
-import os 
-from datetime import datetime
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def insert_conf_paper(paper_dict):
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+MAX_CONCURRENT_REQUESTS = 8  # Politeness limit towards DBLP
+REQUESTS_PER_SECOND = 10  # Request budget towards DBLP, shared by all worker processes
+CONFERENCE_WORKERS = 4  # Processes that each scrape whole conferences independently
+WRITE_BUFFER_SIZE = 100  # Papers per executemany batch in the writer thread
+WRITE_FLUSH_INTERVAL = 0.1  # Seconds before a partial batch is flushed anyway
+WRITER_STOP = object()  # Queue sentinel that tells the writer thread to finish
+DBLP_DUMP_PATH = 'dblp.xml.gz'  # https://dblp.org/xml/dblp.xml.gz (with dblp.dtd next to it)
+DBLP_BASE_URL = 'https://dblp.org/'
+
+# Links that never lead to paper listings (export formats and external sites)
+SKIP_LINK_PATTERNS = [
+    "bibtex", "ris", "rdf", "xml", "endnote", ".nt", ".ttl",
+    "google.com", "scholar.google", "semanticscholar",
+    "citeseer", "pubpeer", "reddit.com", "linkedin.com",
+    "bibsonomy", "bluesky", "twitter.com", "doi.org",
+    "usenix.org", "acm.org", "ieee.org"  # External sites
+]
+# URL fragments that indicate paper/content pages
+VALID_LINK_PATTERNS = [
+    "/db/conf/", "/db/journals/", 
+    "contents", "proceedings"
+]
+# Venue key of a conference page, e.g. https://dblp.org/db/conf/icse/index.html -> conf/icse
+_VENUE_KEY_RE = re.compile(r'/db/(conf/[^/]+)/')
+_SKIP_RE = re.compile('|'.join(map(re.escape, SKIP_LINK_PATTERNS)))
+_VALID_RE = re.compile('|'.join(map(re.escape, VALID_LINK_PATTERNS)))
+
+# Citation text patterns for extract_paper_data. Each is searched on its own because their
+# matches overlap (a year can sit inside a page range or end a location)
+_YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+_PAGES_RES = (
+    re.compile(r'pp\.\s*(\d+(?:-\d+)?)', re.IGNORECASE),
+    re.compile(r'pages?\s+(\d+(?:-\d+)?)', re.IGNORECASE)
+)
+_LOCATION_RES = (
+    re.compile(r'([A-Za-z\s]+),\s*([A-Z]{2,3}),\s*(USA|UK|Germany|France|Italy|Spain|Canada|Australia)'),
+    re.compile(r'([A-Za-z\s]+),\s*([A-Za-z\s]+),\s*\d{4}')
+)
+
+# Column order shared by the conf_papers INSERT statements
+CONF_PAPER_COLUMNS = (
+    'name', 'authors', 'conference_href', 'paper_href', 'year',
+    'isbn', 'pages', 'conference_location',
+    'conference_processed', 'edition_name'
+)
+# Missing keys default to '' and one itemgetter builds the row tuple in C
+_PAPER_DEFAULTS = dict.fromkeys(CONF_PAPER_COLUMNS, '')
+_GET_PAPER_VALUES = itemgetter(*CONF_PAPER_COLUMNS)
+# Papers are unique by their DBLP record link; re-scraped papers are skipped, not replaced.
+# created_at is stamped by SQLite, whatever default the existing column was declared with
+INSERT_CONF_PAPER_QUERY = f"""
+INSERT INTO conf_papers ({', '.join(CONF_PAPER_COLUMNS)}, created_at)
+VALUES ({', '.join('?' * len(CONF_PAPER_COLUMNS))}, CURRENT_TIMESTAMP)
+ON CONFLICT(paper_href) WHERE paper_href <> '' DO NOTHING
+"""
+
+async def fetch(session, url):
+    """Fetch a DBLP page and return its HTML (DBLP is server-rendered, no JS needed)"""
+    async with session.get(url) as response:
+        response.raise_for_status()
+        # Only HTML is parsed; never download the body of anything else
+        if response.content_type != 'text/html':
+            logger.debug(f"Skipping non-HTML response ({response.content_type}): {url}")
+            return ""
+        return await response.text()
+
+def _configure_conn(conn):
+    """Switch a fresh SQLite connection to WAL with relaxed syncing for bulk writes"""
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")  # 64 MB page cache
+    conn.execute("PRAGMA busy_timeout=30000")  # worker processes wait for each other's write locks
+
+def insert_conf_papers_batch(conn, papers, cursor=None):
     """
-    Insert a row into the conf_papers table in DBLP.db
+    Insert many rows into the conf_papers table in DBLP.db in one transaction
     
     Args:
-        paper_dict (dict): Dictionary containing paper information with keys:
-            - name: Paper title
-            - authors: Authors of the paper
-            - conference_href: Conference URL
-            - paper_href: Paper URL
-            - year: Publication year
-            - isbn: ISBN number
-            - pages: Page numbers
-            - conference_location: Conference location
-            - created_at: Creation timestamp (if empty, will use current time)
-            - conference_processed: Processed conference name
-            - edition_name: Edition name
+        conn (sqlite3.Connection): Open connection to DBLP.db
+        papers (list): Paper dictionaries keyed by CONF_PAPER_COLUMNS; missing keys default to ''
+        cursor (sqlite3.Cursor): Long-lived cursor to reuse; a new one is created if omitted
     
     Returns:
-        int: The ROWID of the inserted row, or None if insertion failed
+        int: Number of rows inserted, or 0 if insertion failed
     """
-    
-    # Database file path (in current working directory)
-    db_path = os.path.join(os.getcwd(), 'DBLP.db')
-    
-    # Check if database exists
-    if not os.path.exists(db_path):
-        print(f"Error: Database file {db_path} not found!")
-        return None
+    if not papers:
+        return 0
     
     try:
-        # Connect to the database
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        
-        # If created_at is empty, use current timestamp
-        if not paper_dict.get('created_at'):
-            paper_dict['created_at'] = datetime.now().isoformat()
-        
-        # Prepare the INSERT statement
-        insert_query = """
-        INSERT INTO conf_papers (
-            name, authors, conference_href, paper_href, year, 
-            isbn, pages, conference_location, created_at, 
-            conference_processed, edition_name
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
-        
-        # Extract values from dictionary in the correct order
-        values = (
-            paper_dict.get('name', ''),
-            paper_dict.get('authors', ''),
-            paper_dict.get('conference_href', ''),
-            paper_dict.get('paper_href', ''),
-            paper_dict.get('year', ''),
-            paper_dict.get('isbn', ''),
-            paper_dict.get('pages', ''),
-            paper_dict.get('conference_location', ''),
-            paper_dict.get('created_at', ''),
-            paper_dict.get('conference_processed', ''),
-            paper_dict.get('edition_name', '')
-        )
-        
-        # Execute the insert
-        cursor.execute(insert_query, values)
-        
-        # Get the ROWID of the inserted row
-        rowid = cursor.lastrowid
+        if cursor is None:
+            cursor = conn.cursor()
+        rows = [_GET_PAPER_VALUES({**_PAPER_DEFAULTS, **paper}) for paper in papers]
         
-        # Commit the transaction
-        conn.commit()
+        # Single transaction: one commit for the whole batch (conn is in autocommit mode)
+        with conn:
+            cursor.execute("BEGIN")
+            inserted = cursor.executemany(INSERT_CONF_PAPER_QUERY, rows).rowcount
         
-        print(f"Successfully inserted paper with ROWID: {rowid}")
-        return rowid
+        print(f"Successfully inserted {inserted}/{len(rows)} papers (rest already stored)")
+        return inserted
         
     except sqlite3.Error as e:
         print(f"Database error: {e}")
-        return None
-    
-    except Exception as e:
-        print(f"Error: {e}")
-        return None
-    
-    finally:
-        # Close the connection
-        if conn:
-            conn.close()
+        return 0
 
 class DBLPScraper:
     def __init__(self, db_path='DBLP.db'):
         self.db_path = db_path
-        self.driver = None
-        self.setup_driver()
+        # One session (and connection pool) per run, opened in run_scraper together
+        # with the request limits, since all three belong to that run's event loop
+        self.session = None
+        self.semaphore = None
+        self.limiter = None
+        # One connection for the whole run; transactions are opened explicitly
+        self.conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+        _configure_conn(self.conn)
+        self.setup_database()
+        # Reused for every insert so the same prepared INSERT stays in the statement cache
+        self.cursor = self.conn.cursor()
+        # All writes go through this queue; only the writer thread touches SQLite for inserts
+        self.write_q = queue.Queue()
+        self.writer = threading.Thread(target=self._writer_loop, daemon=True)
+        self.writer.start()
+        
+    def create_session(self):
+        """Create the HTTP session used for all DBLP page fetches"""
+        connector = aiohttp.TCPConnector(limit=50)
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers={
+                'User-Agent': USER_AGENT,
+                'Accept': 'text/html',
+                'Accept-Encoding': 'gzip, deflate'
+            },
+            timeout=aiohttp.ClientTimeout(total=30)
+        )
+    
+    async def fetch_page(self, url):
+        """Fetch and parse a DBLP page while holding one of the request slots"""
+        async with self.semaphore, self.limiter:
+            html = await fetch(self.session, url)
+        return HTMLParser(html)
         
-    def setup_driver(self):
-        """Setup Chrome driver with appropriate options"""
-        chrome_options = Options()
-        # chrome_options.add_argument('--headless')  # Remove this line if you want to see the browser
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
+    def setup_database(self):
+        """Make sure created_at exists and create the unique paper_href index used by inserts"""
+        cursor = self.conn.cursor()
         
-        self.driver = webdriver.Chrome(options=chrome_options)
-        self.driver.implicitly_wait(10)
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='conf_papers'")
+        if not cursor.fetchone():
+            logger.error("conf_papers table does not exist!")
+            return
+        
+        cursor.execute("PRAGMA table_info(conf_papers)")
+        if 'created_at' not in {row[1] for row in cursor.fetchall()}:
+            cursor.execute("ALTER TABLE conf_papers ADD COLUMN created_at TEXT")
+        
+        create_index = """
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_conf_papers_key
+        ON conf_papers(paper_href) WHERE paper_href <> ''
+        """
+        try:
+            cursor.execute(create_index)
+        except sqlite3.IntegrityError:
+            # Earlier runs re-inserted the same papers; keep the first copy of each
+            cursor.execute("""
+                DELETE FROM conf_papers
+                WHERE paper_href <> '' AND rowid NOT IN (
+                    SELECT MIN(rowid) FROM conf_papers WHERE paper_href <> '' GROUP BY paper_href
+                )
+            """)
+            logger.info(f"Removed {cursor.rowcount} duplicate rows from conf_papers")
+            cursor.execute(create_index)
+        logger.info("Database index created/verified for conference papers")
+    
+    def _writer_loop(self):
+        """Drain write_q into conf_papers in batches of WRITE_BUFFER_SIZE or every WRITE_FLUSH_INTERVAL"""
+        buffer = []
+        last_flush = time.monotonic()
+        while True:
+            try:
+                paper = self.write_q.get(timeout=WRITE_FLUSH_INTERVAL)
+            except queue.Empty:
+                paper = None
+            
+            if paper is WRITER_STOP:
+                insert_conf_papers_batch(self.conn, buffer, self.cursor)
+                return
+            if paper is not None:
+                buffer.append(paper)
+            
+            if len(buffer) >= WRITE_BUFFER_SIZE or (buffer and time.monotonic() - last_flush >= WRITE_FLUSH_INTERVAL):
+                insert_conf_papers_batch(self.conn, buffer, self.cursor)
+                buffer = []
+                last_flush = time.monotonic()
+    
+    def stop_writer(self):
+        """Flush everything still queued and wait for the writer thread to exit"""
+        self.write_q.put(WRITER_STOP)
+        self.writer.join()
         
     def get_conference_hrefs(self):
         """Extract href links from Conference_href table"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self.conn.cursor()
         
         cursor.execute("SELECT name, href FROM Conferences_hrefs")
         conferences = cursor.fetchall()
         
-        conn.close()
         return conferences
     
-    def scrape_conference_content_links(self, conference_url):
+    async def scrape_conference_content_links(self, conference_url):
         """Scrape all content links from a conference page using the actual DBLP structure"""
         try:
-            logger.info(f"Navigating to conference page: {conference_url}")
-            self.driver.get(conference_url)
-            
-            # Wait for page to load
-            WebDriverWait(self.driver, 15).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
+            logger.info(f"Fetching conference page: {conference_url}")
+            tree = await self.fetch_page(conference_url)
             
             content_links = []
             
             # Look for the main publication list
             try:
-                publ_lists = self.driver.find_elements(By.CSS_SELECTOR, "ul.publ-list")
+                publ_lists = tree.css("ul.publ-list")
                 logger.info(f"Found {len(publ_lists)} publication lists")
                 
                 for publ_list in publ_lists:
                     # Find all entry items within this list
-                    entries = publ_list.find_elements(By.CSS_SELECTOR, "li.entry")
+                    entries = publ_list.css("li.entry")
                     logger.info(f"Found {len(entries)} entries in publication list")
                     
                     for entry in entries:
@@ -173,7 +265,7 @@ class DBLPScraper:
                 logger.error(f"Error finding publication lists: {e}")
             
             # Also look for direct links in the page that might contain papers
-            additional_links = self.find_additional_content_links()
+            additional_links = self.find_additional_content_links(tree)
             content_links.extend(additional_links)
             
             # Remove duplicates
@@ -197,21 +289,22 @@ class DBLPScraper:
         
         try:
             # Look for the table of contents link specifically
-            toc_link_element = entry.find_element(By.CSS_SELECTOR, "a.toc-link")
-            href = toc_link_element.get_attribute("href")
+            toc_link_element = entry.css_first("a.toc-link")
+            if toc_link_element is None:
+                # No TOC link in this entry
+                return toc_links
+            href = toc_link_element.attributes.get("href")
             
             if href and self.is_valid_content_link(href):
                 # Extract title from the cite element
                 title = "Unknown"
-                try:
-                    title_element = entry.find_element(By.CSS_SELECTOR, "span.title")
-                    title = title_element.text.strip()
-                except:
-                    try:
-                        cite_element = entry.find_element(By.CSS_SELECTOR, "cite.data")
-                        title = cite_element.text.strip().split('\n')[0]  # First line usually contains title
-                    except:
-                        pass
+                title_element = entry.css_first("span.title")
+                if title_element is not None:
+                    title = title_element.text().strip()
+                else:
+                    cite_element = entry.css_first("cite.data")
+                    if cite_element is not None:
+                        title = cite_element.text().strip().split('\n')[0]  # First line usually contains title
                 
                 toc_links.append({
                     'url': href,
@@ -221,9 +314,6 @@ class DBLPScraper:
                 })
                 logger.debug(f"Found TOC link: {title} -> {href}")
                 
-        except NoSuchElementException:
-            # No TOC link in this entry
-            pass
         except Exception as e:
             logger.debug(f"Error extracting TOC links: {e}")
         
@@ -235,17 +325,19 @@ class DBLPScraper:
         
         try:
             # Look in the navigation menu for venue links
-            nav_element = entry.find_element(By.CSS_SELECTOR, "nav.publ")
+            nav_element = entry.css_first("nav.publ")
+            if nav_element is None:
+                return direct_links
             
             # Find links that point to DBLP database pages
-            nav_links = nav_element.find_elements(By.TAG_NAME, "a")
+            nav_links = nav_element.css("a")
             
             for link in nav_links:
-                href = link.get_attribute("href")
+                href = link.attributes.get("href")
                 if href and self.is_valid_content_link(href):
                     # Check if this is a database/venue link
                     if "/db/" in href and href.endswith(".html"):
-                        title = link.get_attribute("title") or link.text.strip()
+                        title = link.attributes.get("title") or link.text().strip()
                         
                         direct_links.append({
                             'url': href,
@@ -255,31 +347,31 @@ class DBLPScraper:
                         })
                         logger.debug(f"Found direct link: {title} -> {href}")
                         
-        except NoSuchElementException:
-            pass
         except Exception as e:
             logger.debug(f"Error extracting direct links: {e}")
         
         return direct_links
     
-    def find_additional_content_links(self):
+    def find_additional_content_links(self, tree):
         """Find additional content links that might not be in the main publication list"""
         additional_links = []
         
         try:
             # Look for any links that contain "contents" or lead to paper listings
-            all_links = self.driver.find_elements(By.TAG_NAME, "a")
+            all_links = tree.css("a[href]")
             
             for link in all_links:
-                href = link.get_attribute("href")
-                text = link.text.strip().lower()
+                href = link.attributes.get("href")
                 
+                # Cheap regex check on href first; only read the text of candidate links
                 if href and self.is_valid_content_link(href):
+                    title = link.text().strip()
+                    text = title.lower()
                     # Look for links that suggest they contain paper listings
                     if any(keyword in text for keyword in ['contents', 'proceedings', 'papers', 'table of contents']):
                         additional_links.append({
                             'url': href,
-                            'title': link.text.strip(),
+                            'title': title,
                             'section': 'additional',
                             'type': 'content_page'
                         })
@@ -298,37 +390,18 @@ class DBLPScraper:
         if "dblp.org" not in url:
             return False
             
-        # Skip certain types of links
-        skip_patterns = [
-            "bibtex", "ris", "rdf", "xml", "endnote", ".nt", ".ttl",
-            "google.com", "scholar.google", "semanticscholar",
-            "citeseer", "pubpeer", "reddit.com", "linkedin.com",
-            "bibsonomy", "bluesky", "twitter.com", "doi.org",
-            "usenix.org", "acm.org", "ieee.org"  # External sites
-        ]
-        
-        for pattern in skip_patterns:
-            if pattern in url.lower():
-                return False
+        # Skip certain types of links (single scan over the lowercased URL)
+        if _SKIP_RE.search(url.lower()):
+            return False
                 
         # Look for patterns that indicate paper/content pages
-        valid_patterns = [
-            "/db/conf/", "/db/journals/", 
-            "contents", "proceedings"
-        ]
-        
-        return any(pattern in url for pattern in valid_patterns)
+        return _VALID_RE.search(url) is not None
     
-    def scrape_papers_from_content_page(self, content_url, conference_name):
+    async def scrape_papers_from_content_page(self, content_url, conference_name):
         """Scrape papers and authors from a content page"""
         try:
             logger.info(f"Scraping papers from: {content_url}")
-            self.driver.get(content_url)
-            
-            # Wait for page to load
-            WebDriverWait(self.driver, 15).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
+            tree = await self.fetch_page(content_url)
             
             papers = []
             
@@ -336,18 +409,21 @@ class DBLPScraper:
             # Use ONLY ONE selector - the most specific one that works
             try:
                 # Try the most specific selector first
-                paper_elements = self.driver.find_elements(By.CSS_SELECTOR, "ul.publ-list li.entry.inproceedings")
+                paper_elements = tree.css("ul.publ-list li.entry.inproceedings")
                 
                 # If no inproceedings found, try articles
                 if not paper_elements:
-                    paper_elements = self.driver.find_elements(By.CSS_SELECTOR, "ul.publ-list li.entry.article")
+                    paper_elements = tree.css("ul.publ-list li.entry.article")
                 
                 # If still nothing, try generic entries
                 if not paper_elements:
-                    paper_elements = self.driver.find_elements(By.CSS_SELECTOR, "ul.publ-list li.entry")
+                    paper_elements = tree.css("ul.publ-list li.entry")
                 
                 logger.info(f"Found {len(paper_elements)} paper elements to process")
                 
+                # Duplicates (same title and authors) are skipped before they reach the writer
+                seen_papers = set()
+                
                 # Process each element ONCE
                 for i, element in enumerate(paper_elements):
                     try:
@@ -357,10 +433,14 @@ class DBLPScraper:
                         if self.is_paper_entry(element):
                             paper_data = self.extract_paper_data(element, conference_name, content_url)
                             if paper_data and paper_data['name'].strip():
+                                paper_key = (paper_data['name'].lower().strip(), paper_data['authors'].lower().strip())
+                                if paper_key in seen_papers:
+                                    continue
+                                seen_papers.add(paper_key)
                                 papers.append(paper_data)
                                 print(paper_data)
-                                insert_conf_paper(paper_data)
-                                # print("papers appended to the the array")
+                                # Hand off to the writer thread; parsing never waits on SQLite
+                                self.write_q.put(paper_data)
                                 
                     except Exception as e:
                         logger.debug(f"Error processing paper {i}: {e}")
@@ -368,17 +448,9 @@ class DBLPScraper:
             except Exception as e:
                 logger.error(f"Error scraping papers from {content_url}: {e}")
                 return []
-            # Remove duplicates based on paper title and authors
-            unique_papers = []
-            seen_papers = set()
-            for paper in papers:
-                paper_key = (paper['name'].lower().strip(), paper['authors'].lower().strip())
-                if paper_key not in seen_papers and paper['name'].strip():
-                    unique_papers.append(paper)
-                    seen_papers.add(paper_key)
             
-            logger.info(f"Found {len(unique_papers)} unique papers")
-            return unique_papers
+            logger.info(f"Found {len(papers)} unique papers")
+            return papers
             
         except Exception as e:
             logger.error(f"Error scraping papers from {content_url}: {e}")
@@ -388,7 +460,7 @@ class DBLPScraper:
         """Check if the entry represents an actual paper (not editorship, etc.)"""
         try:
             # Check for paper-specific classes
-            classes = element.get_attribute("class") or ""
+            classes = element.attributes.get("class") or ""
             
             # Skip editorial entries
             if "editor" in classes or "toc" in classes:
@@ -400,22 +472,14 @@ class DBLPScraper:
                 return True
                 
             # Check if it has author information (papers should have authors)
-            try:
-                authors = element.find_elements(By.CSS_SELECTOR, "span[itemprop='author']")
-                if len(authors) > 0:
-                    return True
-            except:
-                pass
+            if element.css_first("span[itemprop='author']") is not None:
+                return True
                 
             # Check for paper title patterns
-            try:
-                title_elem = element.find_element(By.CSS_SELECTOR, "span.title")
-                title = title_elem.text.strip()
-                # If it has a substantial title, it's likely a paper
-                if len(title) > 10:
-                    return True
-            except:
-                pass
+            title_elem = element.css_first("span.title")
+            # If it has a substantial title, it's likely a paper
+            if title_elem is not None and len(title_elem.text().strip()) > 10:
+                return True
                 
             return False
             
@@ -435,48 +499,40 @@ class DBLPScraper:
                 'isbn': '',
                 'pages': '',
                 'conference_location': '',
-                'created_at': '',
                 'conference_processed': conference_name,
                 'edition_name': ''
             }
             
             # Extract paper title - DBLP uses span.title
-            try:
-                title_elem = element.find_element(By.CSS_SELECTOR, "span.title")
-                paper_data['name'] = title_elem.text.strip()
-            except:
-                # Fallback: try to get title from itemprop
-                try:
-                    title_elem = element.find_element(By.CSS_SELECTOR, "[itemprop='headline'] span.title")
-                    paper_data['name'] = title_elem.text.strip()
-                except:
-                    # Last resort: try cite element text
-                    try:
-                        cite_elem = element.find_element(By.CSS_SELECTOR, "cite")
-                        text = cite_elem.text.strip()
-                        # Title is usually after the authors and before the venue
-                        lines = text.split('\n')
-                        for line in lines:
-                            if len(line) > 20 and not line.startswith('http'):
-                                paper_data['name'] = line.strip().rstrip('.')
-                                break
-                    except:
-                        pass
+            # (the [itemprop='headline'] variant is also a span.title, so one query covers both)
+            title_elem = element.css_first("span.title")
+            if title_elem is not None:
+                paper_data['name'] = title_elem.text().strip()
+            else:
+                # Last resort: try cite element text
+                cite_elem = element.css_first("cite")
+                if cite_elem is not None:
+                    text = cite_elem.text().strip()
+                    # Title is usually after the authors and before the venue
+                    lines = text.split('\n')
+                    for line in lines:
+                        if len(line) > 20 and not line.startswith('http'):
+                            paper_data['name'] = line.strip().rstrip('.')
+                            break
             
-            # Extract authors - DBLP uses span[itemprop='author']
+            # Extract authors - DBLP nests span[itemprop='name'] inside span[itemprop='author'],
+            # so a single query returns every author name of the entry
             authors = []
             try:
-                author_elements = element.find_elements(By.CSS_SELECTOR, "span[itemprop='author']")
-                for auth_elem in author_elements:
-                    try:
-                        # Author name is in nested span[itemprop='name']
-                        name_elem = auth_elem.find_element(By.CSS_SELECTOR, "span[itemprop='name']")
-                        author_name = name_elem.get_attribute("title") or name_elem.text
-                        if author_name and author_name.strip():
-                            authors.append(author_name.strip())
-                    except:
-                        # Fallback to direct text
-                        author_name = auth_elem.text.strip()
+                for name_elem in element.css("span[itemprop='author'] span[itemprop='name']"):
+                    author_name = name_elem.attributes.get("title") or name_elem.text()
+                    if author_name and author_name.strip():
+                        authors.append(author_name.strip())
+                
+                if not authors:
+                    # Fallback to direct text
+                    for auth_elem in element.css("span[itemprop='author']"):
+                        author_name = auth_elem.text().strip()
                         if author_name:
                             authors.append(author_name)
             except:
@@ -486,53 +542,27 @@ class DBLPScraper:
                 paper_data['authors'] = ', '.join(authors)
             
             # Extract paper record link
-            try:
-                # Look for the DBLP record link
-                rec_link = element.find_element(By.CSS_SELECTOR, "a[href*='/rec/']")
-                paper_data['paper_href'] = rec_link.get_attribute("href")
-            except:
-                # Try other patterns
-                try:
-                    links = element.find_elements(By.TAG_NAME, "a")
-                    for link in links:
-                        href = link.get_attribute("href")
-                        if href and "/rec/" in href:
-                            paper_data['paper_href'] = href
-                            break
-                except:
-                    pass
+            rec_link = element.css_first("a[href*='/rec/']")
+            if rec_link is not None:
+                paper_data['paper_href'] = rec_link.attributes.get("href") or ''
             
-            # Extract year - look in the citation text
+            # Extract year, pages and location from the citation text (read once)
             try:
-                cite_text = element.text
-                year_match = re.search(r'\b(19|20)\d{2}\b', cite_text)
+                cite_text = element.text()
+                
+                year_match = _YEAR_RE.search(cite_text)
                 if year_match:
                     paper_data['year'] = year_match.group()
-            except:
-                pass
-            
-            # Extract pages - look for page numbers
-            try:
-                cite_text = element.text
-                pages_match = re.search(r'pp\.\s*(\d+(?:-\d+)?)', cite_text, re.IGNORECASE)
-                if not pages_match:
-                    pages_match = re.search(r'pages?\s+(\d+(?:-\d+)?)', cite_text, re.IGNORECASE)
-                if pages_match:
-                    paper_data['pages'] = pages_match.group(1)
-            except:
-                pass
-            
-            # Try to extract conference location and other details from text
-            try:
-                cite_text = element.text
-                # Look for location patterns
-                location_patterns = [
-                    r'([A-Za-z\s]+),\s*([A-Z]{2,3}),\s*(USA|UK|Germany|France|Italy|Spain|Canada|Australia)',
-                    r'([A-Za-z\s]+),\s*([A-Za-z\s]+),\s*\d{4}'
-                ]
                 
-                for pattern in location_patterns:
-                    match = re.search(pattern, cite_text)
+                # "pp." beats "pages", the country pattern beats the generic one
+                for pattern in _PAGES_RES:
+                    pages_match = pattern.search(cite_text)
+                    if pages_match:
+                        paper_data['pages'] = pages_match.group(1)
+                        break
+                
+                for pattern in _LOCATION_RES:
+                    match = pattern.search(cite_text)
                     if match:
                         paper_data['conference_location'] = match.group().strip()
                         break
@@ -545,146 +575,179 @@ class DBLPScraper:
             logger.debug(f"Error extracting paper data: {e}")
             return None
     
-    def save_papers_to_db(self, papers):
-        """Save scraped papers to the database - DEBUG VERSION"""
-        print(f"DEBUG: save_papers_to_db called with {len(papers) if papers else 0} papers")
-        
-        if not papers:
-            print("DEBUG: No papers to save, returning early")
-            return
-        
+    async def process_content_link(self, conf_name, link_data, all_papers):
+        """Scrape papers from a single content link (the page queues its own papers for saving)"""
         try:
-            print(f"DEBUG: Attempting to connect to database: {self.db_path}")
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Check if table exists
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='conf_papers'")
-            table_exists = cursor.fetchone()
-            print(f"DEBUG: conf_papers table exists: {table_exists is not None}")
-            
-            if not table_exists:
-                print("ERROR: conf_papers table does not exist!")
-                conn.close()
-                return
-            
-            # Insert papers into conf_papers table
-            insert_query = """
-            INSERT OR REPLACE INTO conf_papers 
-            (name, authors, conference_href, paper_href, year, isbn, pages, 
-            conference_location, created_at, conference_processed, edition_name)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """
-            
-            successful_inserts = 0
-            for i, paper in enumerate(papers):
-                try:
-                    cursor.execute(insert_query, (
-                        paper['name'],
-                        paper['authors'], 
-                        paper['conference_href'],
-                        paper['paper_href'],
-                        paper['year'],
-                        paper['isbn'],
-                        paper['pages'],
-                        paper['conference_location'],
-                        paper['created_at'],
-                        paper['conference_processed'],
-                        paper['edition_name']
-                    ))
-                    successful_inserts += 1
-                    
-                    if i == 0:  # Log first paper details
-                        print(f"DEBUG: First paper data - Name: '{paper['name'][:50]}...', Authors: '{paper['authors'][:50]}...'")
-                        
-                except Exception as e:
-                    print(f"DEBUG: Error inserting paper {i}: {e}")
-                    print(f"DEBUG: Paper data: {paper}")
-            
-            conn.commit()
-            conn.close()
-            
-            print(f"DEBUG: Successfully inserted {successful_inserts}/{len(papers)} papers")
-            logger.info(f"Saved {successful_inserts} papers to database")
+            logger.info(f"Processing link: {link_data['title'][:60]}...")
+            papers = await self.scrape_papers_from_content_page(
+                link_data['url'], 
+                conf_name
+            )
             
+            if papers:
+                all_papers.extend(papers)
+                logger.info(f"Got {len(papers)} papers from this link. Total so far: {len(all_papers)}")
+            else:
+                logger.warning(f"No papers found in link: {link_data['url']}")
+                
         except Exception as e:
-            print(f"ERROR: Database save failed: {e}")
-            logger.error(f"Database save error: {e}")
-
-    def run_scraper(self):
-        """Main scraper function - DEBUG VERSION"""
+            logger.error(f"Error processing content link {link_data['url']}: {e}")
+    
+    async def scrape_conference(self, conf_name, conf_url):
+        """Scrape every content link of one conference and queue its papers"""
+        logger.info(f"Processing conference: {conf_name}")
+        
+        # Scrape content links from conference page
+        content_links = await self.scrape_conference_content_links(conf_url)
+        
+        if not content_links:
+            logger.warning(f"No content links found for {conf_name}")
+            return
+        
+        logger.info(f"Found {len(content_links)} content links for {conf_name}")
+        all_papers = []
+        
+        # Process all content links concurrently; fetch_page bounds the fan-out
+        tasks = [
+            self.process_content_link(conf_name, link_data, all_papers)
+            for link_data in content_links
+        ]
+        await asyncio.gather(*tasks)
+        
+        # Papers were already queued page by page; only report the total here
+        if all_papers:
+            logger.info(f" COMPLETED {conf_name}: {len(all_papers)} papers queued for the database")
+        else:
+            logger.warning(f" No papers found for {conf_name}")
+    
+    async def run_scraper(self, conferences=None):
+        """Scrape the given conferences; the scraper stays open for further runs"""
+        self.session = self.create_session()
+        # Bounds how many DBLP requests are in flight at once
+        self.semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        # Token bucket: requests only wait when the worker's share of the budget is used up
+        self.limiter = AsyncLimiter(REQUESTS_PER_SECOND / CONFERENCE_WORKERS, 1)
         try:
-            # Get conference URLs from database
-            conferences = self.get_conference_hrefs()
+            # Get conference URLs from database unless a worker was handed its share
+            if conferences is None:
+                conferences = self.get_conference_hrefs()
             logger.info(f"Found {len(conferences)} conferences to process")
             
             for conf_name, conf_url in conferences:
-                logger.info(f"Processing conference: {conf_name}")
-                
-                # Scrape content links from conference page
-                content_links = self.scrape_conference_content_links(conf_url)
-                
-                if not content_links:
-                    logger.warning(f"No content links found for {conf_name}")
-                    continue
-                
-                logger.info(f"Found {len(content_links)} content links for {conf_name}")
-                all_papers = []
-                
-                # Process each content link
-                for i, link_data in enumerate(content_links):
-                    try:
-                        logger.info(f"Processing link {i+1}/{len(content_links)}: {link_data['title'][:60]}...")
-                        papers = self.scrape_papers_from_content_page(
-                            link_data['url'], 
-                            conf_name
-                        )
-                        
-                        if papers:
-                            all_papers.extend(papers)
-                            logger.info(f"Got {len(papers)} papers from this link. Total so far: {len(all_papers)}")
-                            self.save_papers_to_db(all_papers)
-                        else:
-                            logger.warning(f"No papers found in link: {link_data['url']}")
-                        
-                        # Add delay between requests
-                        time.sleep(2)
-                        
-                    except Exception as e:
-                        logger.error(f"Error processing content link {link_data['url']}: {e}")
-                        continue
-                
-                # DEBUG: Check what we have before saving
-                print(f"\nDEBUG: About to save papers for {conf_name}")
-                print(f"DEBUG: all_papers length: {len(all_papers)}")
-                print(f"DEBUG: all_papers is None: {all_papers is None}")
-                print(f"DEBUG: bool(all_papers): {bool(all_papers)}")
-                
-                if all_papers:
-                    print(f"DEBUG: First paper name: '{all_papers[0]['name'][:50]}...'")
-                    
-                # Save papers to database
-                if all_papers:
-                    logger.info(f"Saving {len(all_papers)} papers to database for {conf_name}")
-                    self.save_papers_to_db(all_papers)
-                    logger.info(f" COMPLETED {conf_name}: {len(all_papers)} papers saved to database")
-                else:
-                    logger.warning(f" No papers found for {conf_name}")
-                
-                # Add delay between conferences
-                time.sleep(3)
+                await self.scrape_conference(conf_name, conf_url)
                 
         except Exception as e:
             logger.error(f"Error in main scraper: {e}")
             import traceback
             print(f"DEBUG: Full traceback: {traceback.format_exc()}")
         finally:
-            if self.driver:
-                self.driver.quit()
+            await self.session.close()
+    
+    def close(self):
+        """Flush queued papers and close the database connection"""
+        self.stop_writer()
+        self.conn.close()
+    
+    def get_conference_venues(self):
+        """Map DBLP venue keys (e.g. 'conf/icse') to conference names from Conferences_hrefs"""
+        venues = {}
+        for conf_name, conf_url in self.get_conference_hrefs():
+            match = _VENUE_KEY_RE.search(conf_url or '')
+            if match:
+                venues[match.group(1)] = conf_name
+        return venues
+    
+    def extract_dump_paper_data(self, element, conference_name):
+        """Build a conf_papers row from an <inproceedings> record of the DBLP XML dump"""
+        title_elem = element.find('title')
+        page_url = (element.findtext('url') or '').split('#')[0]
+        return {
+            'name': ''.join(title_elem.itertext()).strip() if title_elem is not None else '',
+            'authors': ', '.join(author.text.strip() for author in element.iterfind('author') if author.text),
+            'conference_href': DBLP_BASE_URL + page_url if page_url else '',
+            'paper_href': f"{DBLP_BASE_URL}rec/{element.get('key')}.html",
+            'year': element.findtext('year') or '',
+            'isbn': '',
+            'pages': element.findtext('pages') or '',
+            'conference_location': '',
+            'conference_processed': conference_name,
+            'edition_name': ''
+        }
+    
+    def import_from_dump(self, dump_path=DBLP_DUMP_PATH):
+        """Stream the DBLP XML dump and queue the papers of every tracked conference"""
+        venues = self.get_conference_venues()
+        logger.info(f"Importing papers of {len(venues)} conferences from {dump_path}")
+        
+        imported = 0
+        # iterparse does not decompress on its own; the handle keeps the dump's file name,
+        # so dblp.dtd (character entities) next to it still resolves
+        opener = gzip.open if dump_path.endswith('.gz') else open
+        with opener(dump_path, 'rb') as dump:
+            records = etree.iterparse(dump, tag='inproceedings', load_dtd=True, huge_tree=True)
+            for _, element in records:
+                conf_name = venues.get(element.get('key', '').rsplit('/', 1)[0])
+                if conf_name is not None:
+                    paper_data = self.extract_dump_paper_data(element, conf_name)
+                    if paper_data['name']:
+                        self.write_q.put(paper_data)
+                        imported += 1
+                        if imported % 10000 == 0:
+                            logger.info(f"Queued {imported} papers from the dump so far")
+                
+                # Free this record and everything parsed before it so memory stays flat
+                element.clear()
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+        
+        logger.info(f"Queued {imported} papers from the DBLP dump")
+        return imported
+    
+    def run_dump_import(self, dump_path=DBLP_DUMP_PATH):
+        """Fill conf_papers from the DBLP XML dump instead of crawling the HTML pages"""
+        try:
+            self.import_from_dump(dump_path)
+        except Exception as e:
+            logger.error(f"Error importing DBLP dump: {e}")
+        finally:
+            self.close()
                 
+# Set in each pool worker by init_worker
+_worker_scraper = None
+
+def init_worker(db_path):
+    """Pool initializer: one scraper (connection and writer thread) per worker process"""
+    global _worker_scraper
+    _worker_scraper = DBLPScraper(db_path)
+    # Flush the writer's last batch when the worker exits after pool.close()
+    multiprocessing.util.Finalize(_worker_scraper, _worker_scraper.close, exitpriority=10)
+
+def process_conference(conf_row):
+    """Pool worker: scrape one conference with this worker's scraper"""
+    conf_name, conf_url = conf_row
+    asyncio.run(_worker_scraper.run_scraper([conf_row]))
+    return conf_name
+
 def main():
-    scraper = DBLPScraper('DBLP.db')  # Update path to your database
-    scraper.run_scraper()
+    db_path = 'DBLP.db'  # Update path to your database
+    scraper = DBLPScraper(db_path)
+    if len(sys.argv) > 1 and sys.argv[1] == '--dump':
+        # python conf_scrapper.py --dump [path/to/dblp.xml.gz]
+        scraper.run_dump_import(sys.argv[2] if len(sys.argv) > 2 else DBLP_DUMP_PATH)
+    else:
+        # Schema setup already ran in the constructor; workers only need the conference list
+        conferences = scraper.get_conference_hrefs()
+        scraper.close()
+        logger.info(f"Scraping {len(conferences)} conferences with {CONFERENCE_WORKERS} worker processes")
+        
+        pool = multiprocessing.Pool(CONFERENCE_WORKERS, initializer=init_worker, initargs=(db_path,))
+        try:
+            for conf_name in pool.imap_unordered(process_conference, conferences):
+                logger.info(f"Worker finished conference: {conf_name}")
+        finally:
+            # close/join (not terminate) so every worker runs its finalizer and flushes
+            pool.close()
+            pool.join()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,42 +1,42 @@
 import sqlite3
+import sys
 
 def check_database():
     """Check if database and table exist"""
+    # Report lines are collected and written in one go at the end
+    out = []
     try:
         conn = sqlite3.connect('DBLP.db')
         cursor = conn.cursor()
         
-        # Check if conf_papers table exists
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='conf_papers'")
-        table_exists = cursor.fetchone()
+        # Table structure doubles as the existence check: no columns means no conf_papers table
+        cursor.execute("SELECT name, type FROM pragma_table_info('conf_papers')")
+        columns = cursor.fetchall()
         
-        if table_exists:
-            print(" conf_papers table exists")
+        if columns:
+            out.append(" conf_papers table exists")
             
             # Check table structure
-            cursor.execute("PRAGMA table_info(conf_papers)")
-            columns = cursor.fetchall()
-            print(f"Table has {len(columns)} columns:")
-            for col in columns:
-                print(f"  - {col[1]} ({col[2]})")
+            out.append(f"Table has {len(columns)} columns:")
+            out.extend(f"  - {col[0]} ({col[1]})" for col in columns)
             
             # Check if there are any records
             cursor.execute("SELECT COUNT(*) FROM conf_papers")
             count = cursor.fetchone()[0]
-            print(f"Current records in table: {count}")
+            out.append(f"Current records in table: {count}")
             
         else:
-            print(" conf_papers table does NOT exist!")
-            print("Available tables:")
+            out.append(" conf_papers table does NOT exist!")
+            out.append("Available tables:")
             cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-            tables = cursor.fetchall()
-            for table in tables:
-                print(f"  - {table[0]}")
+            out.extend(f"  - {table[0]}" for table in cursor.fetchall())
         
         conn.close()
         
     except Exception as e:
-        print(f"Error checking database: {e}")
+        out.append(f"Error checking database: {e}")
+    
+    sys.stdout.write('\n'.join(out) + '\n')
 
 if __name__ == "__main__":
     check_database()
\ No newline at end of file
@@ -1,37 +1,243 @@
 import sqlite3
 import time
 import re
+import os
+import multiprocessing
+import threading
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+from urllib.parse import urlparse
+import httpx
+import lxml.html
+import lxml.etree
+from lxml.cssselect import CSSSelector
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
 import logging
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+MAX_WORKERS = 8  # Journals scraped in parallel; Chrome is only started when a page needs rendering
+MIN_REQUEST_INTERVAL = 1.5  # Seconds between two requests to the same host
+PARSE_CHUNKSIZE = 32  # Paper entries handed to a parse worker at a time
+
+# journal_papers columns filled by the scraper, in INSERT order
+JOURNAL_PAPER_COLUMNS = (
+    'name', 'authors', 'journal_href', 'paper_href', 'year',
+    'volume', 'issue', 'pages', 'doi', 'journal_name'
+)
+
+# CSS selectors are translated to XPath once here instead of on every cssselect() call
+# Paper entries on a volume page - DBLP journals use specific classes
+PAPER_SELECTORS = tuple(CSSSelector(css) for css in (
+    ".entry.article",
+    ".publ-list li",
+    "li[class*='entry']",
+    "cite.data",
+    ".article-entry",
+    ".paper-entry"
+))
+ANY_PAPER_SELECTOR = CSSSelector(", ".join(selector.css for selector in PAPER_SELECTORS))
+# Candidate volume links on a journal page, filtered by _VOL_HREF_RE
+VOLUME_LINK_SELECTOR = CSSSelector("ul.publ-list a, a[href*='/db/journals/']")
+# Candidate selectors for a paper's title and authors, most specific first
+TITLE_SELECTORS = tuple(CSSSelector(css) for css in (
+    ".title",
+    "span[itemprop='name']",
+    "span.title",
+    "cite span:first-child"
+))
+AUTHOR_SELECTORS = tuple(CSSSelector(css) for css in (
+    "span[itemprop='author']",
+    ".author",
+    "span.author",
+    "a[href*='/pers/']"
+))
+HEADING_SELECTOR = CSSSelector("h1")
+LINK_SELECTOR = CSSSelector("a")
+
+# Patterns used for every journal, volume and paper, compiled once
+_YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+_YEAR_RANGE_RE = re.compile(r'\b(?:19|20)\d{2}-(?:19|20)?\d{2}\b')
+_VOL_RE = re.compile(r'(?:volume|vol\.?)\s*(\d+)', re.I)
+_VOL_HREF_RE = re.compile(r'/db/journals/[^/]+/[^.]*\d+', re.I)  # e.g. /db/journals/tods/tods48.html
+# Paper metadata fields may overlap (e.g. "Vol. 12-14"), so each gets its own search
+_PAPER_VOL_RE = re.compile(r'Vol\.?\s*(\d+)', re.I)
+_PAPER_ISSUE_RE = re.compile(r'(?:No\.?|Issue)\s*(\d+)', re.I)
+_PAPER_PAGES_RE = re.compile(r'(\d+-\d+)')
+_PAPER_DOI_RE = re.compile(r'doi[:\s]*(10\.\d+/[^\s]+)', re.I)
+_ISSN_RE = re.compile(r'ISSN\s+([\d-]+)')
+
+def _configure_conn(conn):
+    """Switch a SQLite connection to WAL with relaxed syncing for bulk writes"""
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")  # 64 MB page cache
+    conn.execute("PRAGMA mmap_size=268435456")  # 256 MB memory-mapped reads
+
+def _clip(text, limit):
+    """Truncate text to limit characters, returning it unchanged (no copy) when it already fits"""
+    return text if len(text) <= limit else text[:limit]
+
+def parse_paper(html_fragment, journal_info, volume_info=None, title_index=None, author_index=None):
+    """
+    Extract one journal paper's information; runs in a worker process
+    
+    Args:
+        html_fragment (bytes): Serialized paper entry element, links already absolute
+        journal_info (dict): Journal information with at least 'name'
+        volume_info (dict): Volume and year of the page the entry came from
+        title_index (int): Index into TITLE_SELECTORS that matched on this page, tried first
+        author_index (int): Index into AUTHOR_SELECTORS that matched on this page, tried first
+    
+    Returns:
+        dict: Paper data, or None if extraction failed
+    """
+    paper_data = {}
+    
+    try:
+        paper_element = lxml.html.fragment_fromstring(html_fragment)
+        # Full entry text is serialized once and shared by the title fallback and the metadata scan
+        paper_text = paper_element.text_content()
+        
+        # Extract paper title
+        title_selectors = TITLE_SELECTORS if title_index is None else (TITLE_SELECTORS[title_index],) + TITLE_SELECTORS
+        
+        paper_data['title'] = ""
+        for selector in title_selectors:
+            title_elements = selector(paper_element)
+            if title_elements:
+                paper_data['title'] = title_elements[0].text_content().strip()
+                break
+        
+        # If no title found with selectors, try to get first text content
+        if not paper_data['title']:
+            paper_data['title'] = paper_text.strip().split('\n')[0].strip()
+        
+        # Extract authors
+        authors = []
+        author_selectors = AUTHOR_SELECTORS if author_index is None else (AUTHOR_SELECTORS[author_index],) + AUTHOR_SELECTORS
+        
+        for selector in author_selectors:
+            for author_elem in selector(paper_element):
+                author_name = author_elem.text_content().strip()
+                if author_name:
+                    authors.append(author_name)
+            if authors:
+                break
+        
+        paper_data['authors_text'] = ', '.join(authors)
+        
+        # Extract paper href
+        paper_links = LINK_SELECTOR(paper_element)
+        paper_data['href'] = paper_links[0].get('href', '') if paper_links else ""
+        
+        # Extract year - try from volume_info first, then paper text
+        if volume_info and 'year' in volume_info:
+            paper_data['year'] = volume_info['year']
+        else:
+            year_match = _YEAR_RE.search(paper_text)
+            paper_data['year'] = year_match.group() if year_match else ""
+        
+        # Extract volume - try from volume_info first, then paper text
+        if volume_info and 'volume' in volume_info:
+            paper_data['volume'] = volume_info['volume']
+        else:
+            volume_match = _PAPER_VOL_RE.search(paper_text)
+            paper_data['volume'] = volume_match.group(1) if volume_match else ""
+        
+        # Extract issue/number
+        issue_match = _PAPER_ISSUE_RE.search(paper_text)
+        paper_data['issue'] = issue_match.group(1) if issue_match else ""
+        
+        # Extract pages
+        pages_match = _PAPER_PAGES_RE.search(paper_text)
+        paper_data['pages'] = pages_match.group(1) if pages_match else ""
+        
+        # Extract DOI if present
+        doi_match = _PAPER_DOI_RE.search(paper_text)
+        paper_data['doi'] = doi_match.group(1) if doi_match else ""
+        
+        # Add journal info
+        paper_data['journal_name'] = journal_info.get('name', '')
+        
+        return paper_data
+        
+    except Exception as e:
+        logger.error(f"Error extracting journal paper info: {e}")
+        return None
+
 class DBLPJournalScraper:
     def __init__(self, db_path="DBLP.db"):
         self.db_path = db_path
-        self.driver = None
-        self.setup_driver()
+        # Paper parsing is CPU bound; fork the workers before any threads or connections exist
+        self.pool = multiprocessing.Pool(os.cpu_count())
+        # Each worker thread lazily gets its own driver; all of them are kept for shutdown
+        self.local = threading.local()
+        self.drivers = []
+        self.profile_dirs = []
+        self.drivers_lock = threading.Lock()
+        # Per-host politeness: next time a request to each netloc may start
+        self.next_request_at = {}
+        self.rate_lock = threading.Lock()
+        # DBLP serves static HTML, so plain GETs replace the browser; the client is shared by all threads
+        self.client = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_connections=10),
+            headers={'User-Agent': USER_AGENT},
+            timeout=30,
+            follow_redirects=True
+        )
+        # One connection for the whole run; transactions are opened explicitly
+        self.conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+        _configure_conn(self.conn)
+        # Worker threads save their own volumes; one transaction at a time on the shared connection
+        self.db_lock = threading.Lock()
         self.setup_database()
     
+    @property
+    def driver(self):
+        """Chrome driver owned by the calling thread, created on first use"""
+        if getattr(self.local, 'driver', None) is None:
+            self.setup_driver()
+        return self.local.driver
+    
     def setup_driver(self):
-        """Setup Chrome driver with options"""
+        """Setup Chrome driver with options for the calling thread"""
         chrome_options = Options()
         # chrome_options.add_argument("--headless")  # Run in background
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--disable-gpu")
         chrome_options.add_argument("--window-size=1920,1080")
+        # DBLP pages are plain HTML: skip images and stylesheets, and stop waiting once the DOM is parsed
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "permissions.default.stylesheet": 2
+        })
+        chrome_options.page_load_strategy = 'eager'
+        # Own profile per driver so its disk cache is reused across navigations in this run
+        profile_dir = tempfile.mkdtemp(prefix="dblp-chrome-")
+        chrome_options.add_argument(f"--user-data-dir={profile_dir}")
         
         try:
-            self.driver = webdriver.Chrome(options=chrome_options)
-            self.driver.implicitly_wait(10)
+            # No implicit wait: render_tree waits explicitly for the one element each page needs
+            driver = webdriver.Chrome(options=chrome_options)
+            self.local.driver = driver
+            with self.drivers_lock:
+                self.drivers.append(driver)
+                self.profile_dirs.append(profile_dir)
             logger.info("Chrome driver initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize Chrome driver: {e}")
@@ -39,15 +245,15 @@ class DBLPJournalScraper:
     
     def setup_database(self):
         """Create tables for storing scraped journal data"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self.conn.cursor()
         
         # Check if journal_papers table exists and get its columns
         cursor.execute("PRAGMA table_info(journal_papers)")
-        existing_columns = [column[1] for column in cursor.fetchall()]
+        column_names = [column[1] for column in cursor.fetchall()]
+        existing_columns = frozenset(column_names)
         
         if existing_columns:
-            logger.info(f"Found existing journal_papers table with columns: {existing_columns}")
+            logger.info(f"Found existing journal_papers table with columns: {column_names}")
             
             # Add missing columns to existing table
             additional_columns = {
@@ -89,37 +295,96 @@ class DBLPJournalScraper:
             ''')
             logger.info("Created new journal_papers table")
         
-        conn.commit()
-        conn.close()
+        # Build the INSERT once for the columns the table has after any ALTERs
+        cursor.execute("PRAGMA table_info(journal_papers)")
+        column_names = [column[1] for column in cursor.fetchall()]
+        existing_columns = frozenset(column_names)
+        logger.info(f"Available columns in journal_papers: {column_names}")
+        
+        self.journal_columns = tuple(column for column in JOURNAL_PAPER_COLUMNS if column in existing_columns)
+        if self.journal_columns:
+            self.journal_insert_sql = (
+                f"INSERT INTO journal_papers ({', '.join(self.journal_columns)}) "
+                f"VALUES ({', '.join(':' + column for column in self.journal_columns)})"
+            )
+        else:
+            self.journal_insert_sql = None
+        
         logger.info("Database table created/verified for journals")
     
+    def wait_for_slot(self, url):
+        """Block until a request to url's host keeps MIN_REQUEST_INTERVAL from the previous one"""
+        netloc = urlparse(url).netloc
+        with self.rate_lock:
+            now = time.monotonic()
+            start_at = max(now, self.next_request_at.get(netloc, 0))
+            self.next_request_at[netloc] = start_at + MIN_REQUEST_INTERVAL
+        if start_at > now:
+            time.sleep(start_at - now)
+    
+    def get_page(self, url):
+        """Navigate this thread's driver to url, respecting the per-host rate limit"""
+        self.wait_for_slot(url)
+        self.driver.get(url)
+    
+    def fetch_tree(self, url, required_selector):
+        """Fetch url over HTTP and parse it with lxml, rendering in Chrome only if required_selector finds nothing"""
+        self.wait_for_slot(url)
+        try:
+            response = self.client.get(url)
+            response.raise_for_status()
+            tree = lxml.html.fromstring(response.content, base_url=str(response.url))
+            tree.make_links_absolute()
+            if required_selector(tree):
+                return tree
+            logger.info(f"Expected content missing from static HTML, rendering in Chrome: {url}")
+        except httpx.HTTPError as e:
+            logger.warning(f"HTTP fetch failed for {url}, rendering in Chrome: {e}")
+        
+        return self.render_tree(url, required_selector)
+    
+    def render_tree(self, url, required_selector):
+        """Fallback for pages whose content needs JavaScript: load in Chrome and parse the rendered DOM"""
+        self.get_page(url)
+        try:
+            # Proceed as soon as the document and the required element are ready
+            WebDriverWait(self.driver, 8).until(
+                lambda driver: driver.execute_script("return document.readyState") != "loading"
+            )
+            WebDriverWait(self.driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, required_selector.css))
+            )
+        except TimeoutException:
+            logger.warning(f"Timed out waiting for {url} to be ready ('{required_selector.css}')")
+        tree = lxml.html.fromstring(self.driver.page_source, base_url=self.driver.current_url)
+        tree.make_links_absolute()
+        return tree
+    
     def get_journal_hrefs(self):
         """Get all journal hrefs from database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self.conn.cursor()
         
         cursor.execute("SELECT name, href FROM journals_hrefs")
         hrefs = cursor.fetchall()
-        conn.close()
         
         logger.info(f"Retrieved {len(hrefs)} journal hrefs from database")
         return hrefs
     
-    def extract_journal_info(self, page_source):
+    def extract_journal_info(self, tree):
         """Extract journal information from the page"""
         journal_info = {}
         
         # Extract journal name
-        try:
-            journal_name_element = self.driver.find_element(By.CSS_SELECTOR, "h1")
-            journal_info['name'] = journal_name_element.text.strip()
-        except NoSuchElementException:
+        headings = HEADING_SELECTOR(tree)
+        if headings:
+            journal_info['name'] = headings[0].text_content().strip()
+        else:
             journal_info['name'] = "Unknown Journal"
         
         # Extract additional metadata
         try:
             # Look for ISSN if present
-            issn_match = re.search(r'ISSN\s+([\d-]+)', page_source)
+            issn_match = _ISSN_RE.search(tree.text_content())
             journal_info['issn'] = issn_match.group(1) if issn_match else ""
             
         except Exception as e:
@@ -128,57 +393,25 @@ class DBLPJournalScraper:
         
         return journal_info
     
-    def find_volume_links(self):
+    def find_volume_links(self, tree):
         """Find all volume links from the journal main page"""
         try:
             volume_links = []
+            seen_hrefs = set()
             
-            # Look for volume links - these are typically in a list format
-            volume_selectors = [
-                "a[href*='Volume']",
-                "a[href*='volume']",
-                "a[href*='vol']",
-                ".volume-link",
-                "li a"  # Generic list links
-            ]
-            
-            for selector in volume_selectors:
-                try:
-                    links = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for link in links:
-                        link_text = link.text.strip()
-                        link_href = link.get_attribute('href')
-                        
-                        # Check if this looks like a volume link
-                        if (re.search(r'volume\s*\d+', link_text, re.IGNORECASE) or 
-                            re.search(r'vol\.?\s*\d+', link_text, re.IGNORECASE) or
-                            'volume' in link_href.lower()):
-                            
-                            volume_links.append({
-                                'text': link_text,
-                                'href': link_href
-                            })
-                    
-                    if volume_links:
-                        logger.info(f"Found {len(volume_links)} volume links using selector: {selector}")
-                        break
-                        
-                except Exception:
+            # One query for candidate links; the href pattern decides which are volumes
+            for link in VOLUME_LINK_SELECTOR(tree):
+                link_href = link.get('href', '')
+                if link_href in seen_hrefs or not _VOL_HREF_RE.search(link_href):
                     continue
+                
+                seen_hrefs.add(link_href)
+                volume_links.append({
+                    'text': link.text_content().strip(),
+                    'href': link_href
+                })
             
-            # If no volume links found with CSS selectors, try XPath
-            if not volume_links:
-                try:
-                    xpath_links = self.driver.find_elements(By.XPATH, "//a[contains(text(), 'Volume') or contains(text(), 'volume')]")
-                    for link in xpath_links:
-                        volume_links.append({
-                            'text': link.text.strip(),
-                            'href': link.get_attribute('href')
-                        })
-                    logger.info(f"Found {len(volume_links)} volume links using XPath")
-                except Exception:
-                    pass
-            
+            logger.info(f"Found {len(volume_links)} volume links")
             return volume_links
             
         except Exception as e:
@@ -188,44 +421,43 @@ class DBLPJournalScraper:
     def scrape_papers_from_volume(self, volume_url, journal_info, volume_info):
         """Scrape papers from a specific volume page"""
         try:
-            self.driver.get(volume_url)
-            time.sleep(2)
-            
             papers = []
             
-            # Look for paper entries - DBLP journals use specific classes
-            paper_selectors = [
-                ".entry.article",
-                ".publ-list li",
-                "li[class*='entry']",
-                "cite.data",
-                ".article-entry",
-                ".paper-entry"
-            ]
+            tree = self.fetch_tree(volume_url, ANY_PAPER_SELECTOR)
             
-            paper_elements = []
-            for selector in paper_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        paper_elements = elements
-                        logger.info(f"Found {len(elements)} journal papers using selector: {selector}")
-                        break
-                except Exception:
-                    continue
+            # DBLP pages are homogeneous: start from the selectors that won on this thread's last page
+            hints = self.selector_hints()
             
-            if not paper_elements:
+            # Look for paper entries
+            paper_index, paper_elements = self.find_matching_selector(tree, PAPER_SELECTORS, hints['paper'])
+            if paper_index is None:
                 logger.warning(f"No journal paper elements found in volume: {volume_info}")
                 return papers
-            
-            for paper_element in paper_elements:
-                try:
-                    paper_data = self.extract_journal_paper_info(paper_element, journal_info, volume_info)
-                    if paper_data:
-                        papers.append(paper_data)
-                except Exception as e:
-                    logger.error(f"Error extracting journal paper info: {e}")
-                    continue
+            hints['paper'] = paper_index
+            logger.info(f"Found {len(paper_elements)} journal papers using selector: {PAPER_SELECTORS[paper_index].css}")
+            
+            # Entries on one page share their markup, so probe the selectors once per page
+            title_index, _ = self.find_matching_selector(paper_elements[0], TITLE_SELECTORS, hints['title'])
+            author_index, _ = self.find_matching_selector(paper_elements[0], AUTHOR_SELECTORS, hints['author'])
+            if title_index is not None:
+                hints['title'] = title_index
+            if author_index is not None:
+                hints['author'] = author_index
+            
+            # Parse the entries in the process pool; lxml elements are sent as serialized HTML
+            fragments = [lxml.etree.tostring(element, with_tail=False) for element in paper_elements]
+            parse = partial(
+                parse_paper,
+                journal_info=journal_info,
+                volume_info=volume_info,
+                title_index=title_index,
+                author_index=author_index
+            )
+            papers = [
+                paper_data
+                for paper_data in self.pool.map(parse, fragments, chunksize=PARSE_CHUNKSIZE)
+                if paper_data
+            ]
             
             logger.info(f"Scraped {len(papers)} papers from volume: {volume_info}")
             return papers
@@ -234,190 +466,75 @@ class DBLPJournalScraper:
             logger.error(f"Error scraping papers from volume {volume_info}: {e}")
             return []
     
-    def extract_journal_paper_info(self, paper_element, journal_info, volume_info=None):
-        """Extract individual journal paper information"""
-        paper_data = {}
-        
-        try:
-            # Extract paper title
-            title_selectors = [
-                ".title",
-                "span[itemprop='name']",
-                "span.title",
-                "cite span:first-child"
-            ]
-            
-            paper_data['title'] = ""
-            for selector in title_selectors:
-                try:
-                    title_element = paper_element.find_element(By.CSS_SELECTOR, selector)
-                    paper_data['title'] = title_element.text.strip()
-                    break
-                except NoSuchElementException:
-                    continue
-            
-            # If no title found with selectors, try to get first text content
-            if not paper_data['title']:
-                paper_data['title'] = paper_element.text.split('\n')[0].strip()
-            
-            # Extract authors
-            authors = []
-            author_selectors = [
-                "span[itemprop='author']",
-                ".author",
-                "span.author",
-                "a[href*='/pers/']"
-            ]
-            
-            for selector in author_selectors:
-                try:
-                    author_elements = paper_element.find_elements(By.CSS_SELECTOR, selector)
-                    for author_elem in author_elements:
-                        author_name = author_elem.text.strip()
-                        if author_name:
-                            authors.append(author_name)
-                    if authors:
-                        break
-                except NoSuchElementException:
-                    continue
-            
-            paper_data['authors_text'] = ', '.join(authors)
-            
-            # Extract paper href
-            try:
-                paper_link = paper_element.find_element(By.CSS_SELECTOR, "a")
-                paper_data['href'] = paper_link.get_attribute('href')
-            except NoSuchElementException:
-                paper_data['href'] = ""
-            
-            # Extract journal-specific information
-            paper_text = paper_element.text
-            
-            # Extract year - try from volume_info first, then paper text
-            if volume_info and 'year' in volume_info:
-                paper_data['year'] = volume_info['year']
-            else:
-                year_match = re.search(r'\b(19|20)\d{2}\b', paper_text)
-                paper_data['year'] = year_match.group() if year_match else ""
-            
-            # Extract volume - try from volume_info first, then paper text
-            if volume_info and 'volume' in volume_info:
-                paper_data['volume'] = volume_info['volume']
-            else:
-                volume_match = re.search(r'Vol\.?\s*(\d+)', paper_text, re.IGNORECASE)
-                paper_data['volume'] = volume_match.group(1) if volume_match else ""
-            
-            # Extract issue/number
-            issue_match = re.search(r'(?:No\.?|Issue)\s*(\d+)', paper_text, re.IGNORECASE)
-            paper_data['issue'] = issue_match.group(1) if issue_match else ""
-            
-            # Extract pages
-            pages_match = re.search(r'(\d+-\d+)', paper_text)
-            paper_data['pages'] = pages_match.group(1) if pages_match else ""
-            
-            # Extract DOI if present
-            doi_match = re.search(r'doi[:\s]*(10\.\d+/[^\s]+)', paper_text, re.IGNORECASE)
-            paper_data['doi'] = doi_match.group(1) if doi_match else ""
-            
-            # Add journal info
-            paper_data['journal_name'] = journal_info.get('name', '')
-            
-            return paper_data
-            
-        except Exception as e:
-            logger.error(f"Error extracting journal paper info: {e}")
-            return None
+    def selector_hints(self):
+        """Indices of the paper/title/author selectors that last matched on the calling thread"""
+        if not hasattr(self.local, 'selector_hints'):
+            self.local.selector_hints = {'paper': 0, 'title': 0, 'author': 0}
+        return self.local.selector_hints
+    
+    def find_matching_selector(self, element, selectors, hint=0):
+        """Try selectors starting at index hint; return (index, matches) of the first hit or (None, [])"""
+        for offset in range(len(selectors)):
+            index = (hint + offset) % len(selectors)
+            matches = selectors[index](element)
+            if matches:
+                return index, matches
+        return None, []
     
     def save_journal_papers_to_db(self, papers, journal_href):
         """Save scraped journal papers to database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Get existing columns to build dynamic query
-        cursor.execute("PRAGMA table_info(journal_papers)")
-        columns_info = cursor.fetchall()
-        existing_columns = [column[1] for column in columns_info]
-        
-        logger.info(f"Available columns in journal_papers: {existing_columns}")
+        if not self.journal_insert_sql:
+            logger.error("journal_papers has none of the scraper's columns, nothing saved")
+            return
         
-        for paper in papers:
-            try:
-                # Prepare data for insertion based on existing columns
-                insert_data = {}
-                
-                # Map data to existing columns
-                if 'name' in existing_columns:
-                    insert_data['name'] = paper.get('title', '')[:500]  # Truncate if too long
-                
-                if 'authors' in existing_columns:
-                    insert_data['authors'] = paper.get('authors_text', '')[:1000]  # Truncate if too long
-                
-                # Add additional columns if they exist
-                if 'journal_href' in existing_columns:
-                    insert_data['journal_href'] = journal_href
-                
-                if 'paper_href' in existing_columns:
-                    insert_data['paper_href'] = paper.get('href', '')
-                
-                if 'year' in existing_columns:
-                    insert_data['year'] = paper.get('year', '')
-                
-                if 'volume' in existing_columns:
-                    insert_data['volume'] = paper.get('volume', '')
-                
-                if 'issue' in existing_columns:
-                    insert_data['issue'] = paper.get('issue', '')
-                
-                if 'pages' in existing_columns:
-                    insert_data['pages'] = paper.get('pages', '')
-                
-                if 'doi' in existing_columns:
-                    insert_data['doi'] = paper.get('doi', '')
-                
-                if 'journal_name' in existing_columns:
-                    insert_data['journal_name'] = paper.get('journal_name', '')
-                
-                # Build dynamic INSERT query
-                if insert_data:
-                    columns = ', '.join(insert_data.keys())
-                    placeholders = ', '.join(['?' for _ in insert_data])
-                    values = list(insert_data.values())
-                    
-                    query = f'INSERT INTO journal_papers ({columns}) VALUES ({placeholders})'
-                    cursor.execute(query, values)
-                
-            except Exception as e:
-                logger.error(f"Error saving journal paper '{paper.get('title', 'Unknown')}' to database: {e}")
-                continue
+        # Named parameters: the prepared INSERT only reads the keys of the columns the table has
+        rows = (
+            {
+                'name': _clip(paper.get('title', ''), 500),  # Truncate if too long
+                'authors': _clip(paper.get('authors_text', ''), 1000),  # Truncate if too long
+                'journal_href': journal_href,
+                'paper_href': paper.get('href', ''),
+                'year': paper.get('year', ''),
+                'volume': paper.get('volume', ''),
+                'issue': paper.get('issue', ''),
+                'pages': paper.get('pages', ''),
+                'doi': paper.get('doi', ''),
+                'journal_name': paper.get('journal_name', '')
+            }
+            for paper in papers
+        )
         
-        conn.commit()
-        conn.close()
-        logger.info(f"Saved {len(papers)} journal papers to database")
+        # One transaction and one prepared statement for the whole batch
+        try:
+            with self.db_lock, self.conn:
+                self.conn.execute("BEGIN IMMEDIATE")
+                self.conn.executemany(self.journal_insert_sql, rows)
+            logger.info(f"Saved {len(papers)} journal papers to database")
+        except sqlite3.Error as e:
+            logger.error(f"Error saving {len(papers)} journal papers to database: {e}")
     
     def scrape_journal(self, journal_name, journal_href):
-        """Scrape a single journal by going through all its volumes"""
+        """Scrape a single journal volume by volume, saving each volume's papers as it goes"""
+        paper_count = 0
         try:
             logger.info(f"Scraping journal: {journal_name}")
             logger.info(f"URL: {journal_href}")
             
-            # Navigate to journal main page
-            self.driver.get(journal_href)
-            time.sleep(2)
+            # Fetch journal main page
+            tree = self.fetch_tree(journal_href, HEADING_SELECTOR)
             
             # Extract journal information
-            journal_info = self.extract_journal_info(self.driver.page_source)
+            journal_info = self.extract_journal_info(tree)
             
             # Find all volume links from the main page
-            volume_links = self.find_volume_links()
+            volume_links = self.find_volume_links(tree)
             
             if not volume_links:
                 logger.warning(f"No volume links found for {journal_name}")
-                return
+                return paper_count
             
             logger.info(f"Found {len(volume_links)} volumes for {journal_name}")
             
-            all_papers = []
-            
             # Scrape each volume
             for i, volume_link in enumerate(volume_links, 1):
                 try:
@@ -433,45 +550,40 @@ class DBLPJournalScraper:
                         volume_info
                     )
                     
-                    all_papers.extend(volume_papers)
-                    
-                    # Add delay between volume requests
-                    time.sleep(1)
+                    # Save now so memory stays bounded by one volume and writes overlap the next fetch
+                    if volume_papers:
+                        self.save_journal_papers_to_db(volume_papers, journal_href)
+                        paper_count += len(volume_papers)
                     
                 except Exception as e:
                     logger.error(f"Error scraping volume {volume_link['text']}: {e}")
                     continue
             
-            if all_papers:
-                # Save all papers to database
-                self.save_journal_papers_to_db(all_papers, journal_href)
-                logger.info(f"Successfully scraped {len(all_papers)} papers from {journal_name}")
+            if paper_count:
+                logger.info(f"Successfully scraped {paper_count} papers from {journal_name}")
             else:
                 logger.warning(f"No papers found for {journal_name}")
                 
         except Exception as e:
             logger.error(f"Error scraping journal {journal_name}: {e}")
+        
+        return paper_count
     
     def extract_volume_info(self, volume_text):
         """Extract volume and year information from volume link text"""
         volume_info = {}
         
-        # Extract volume number
-        volume_match = re.search(r'volume\s*(\d+)', volume_text, re.IGNORECASE)
-        if volume_match:
-            volume_info['volume'] = volume_match.group(1)
-        else:
-            # Try alternative patterns
-            vol_match = re.search(r'vol\.?\s*(\d+)', volume_text, re.IGNORECASE)
-            volume_info['volume'] = vol_match.group(1) if vol_match else ""
+        # Extract volume number ("Volume 12", "Vol. 12", "vol12")
+        volume_match = _VOL_RE.search(volume_text)
+        volume_info['volume'] = volume_match.group(1) if volume_match else ""
         
         # Extract year
-        year_match = re.search(r'\b(19|20)\d{2}\b', volume_text)
+        year_match = _YEAR_RE.search(volume_text)
         if year_match:
             volume_info['year'] = year_match.group()
         else:
             # Try to extract year range (e.g., "2017-2019")
-            year_range_match = re.search(r'\b(19|20)\d{2}-(19|20)?\d{2}\b', volume_text)
+            year_range_match = _YEAR_RANGE_RE.search(volume_text)
             if year_range_match:
                 # Use the first year of the range
                 volume_info['year'] = year_range_match.group().split('-')[0]
@@ -486,29 +598,39 @@ class DBLPJournalScraper:
             # Get all journal hrefs
             journal_hrefs = self.get_journal_hrefs()
             
-            logger.info(f"Starting to scrape {len(journal_hrefs)} journals")
+            logger.info(f"Starting to scrape {len(journal_hrefs)} journals with {MAX_WORKERS} workers")
             
-            for i, (journal_name, journal_href) in enumerate(journal_hrefs, 1):
-                logger.info(f"Processing {i}/{len(journal_hrefs)}: {journal_name}")
+            # Workers fetch, parse and save volume by volume
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                futures = {
+                    executor.submit(self.scrape_journal, journal_name, journal_href): journal_name
+                    for journal_name, journal_href in journal_hrefs
+                }
                 
-                try:
-                    self.scrape_journal(journal_name, journal_href)
-                    
-                    # Add delay between requests to be respectful
-                    time.sleep(2)
+                for i, future in enumerate(as_completed(futures), 1):
+                    journal_name = futures[future]
                     
-                except Exception as e:
-                    logger.error(f"Failed to scrape {journal_name}: {e}")
-                    continue
+                    try:
+                        paper_count = future.result()
+                        logger.info(f"Finished {i}/{len(journal_hrefs)}: {journal_name} ({paper_count} papers)")
+                    except Exception as e:
+                        logger.error(f"Failed to scrape {journal_name}: {e}")
+                        continue
             
             logger.info("Finished scraping all journals")
             
         except Exception as e:
             logger.error(f"Error in scrape_all_journals: {e}")
         finally:
-            if self.driver:
-                self.driver.quit()
-                logger.info("Driver closed")
+            self.pool.close()
+            self.pool.join()
+            self.client.close()
+            self.conn.close()
+            for driver in self.drivers:
+                driver.quit()
+            for profile_dir in self.profile_dirs:
+                shutil.rmtree(profile_dir, ignore_errors=True)
+            logger.info(f"Closed {len(self.drivers)} drivers")
 
 def main():
     """Main function to run the journal scraper"""
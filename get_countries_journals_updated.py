@@ -1,142 +1,534 @@
 import sqlite3
-import requests
+import httpx
+import diskcache
+try:
+    import ahocorasick
+except ImportError:
+    # pyahocorasick is optional; keyword matching falls back to substring scans
+    ahocorasick = None
 import csv
 from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+import re
+import threading
 import time
 import urllib.parse
-from urllib.parse import quote
 import sys
 import os
 
+# Papers looked up concurrently; the token buckets below keep each API host
+# under its request budget regardless of how many workers are in flight
+MAX_WORKERS = 16
+REQUESTS_PER_SECOND = 5
+# Author names OR-ed into a single OpenAlex search request
+OPENALEX_BATCH_SIZE = 25
+# Responses worth retrying, and how often / how long to back off between tries
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.3
+# Papers per transaction when writing first-author countries back to the DB
+UPDATE_BATCH_SIZE = 5000
+
+# Lookup results persist on disk between runs and expire after 30 days so
+# affiliations that moved are eventually fetched again
+CACHE_TTL = 30 * 86400
+# Empty results are retried sooner than real hits
+NEGATIVE_CACHE_TTL = 86400
+# Caches are bounded and drop the oldest stored entries first (diskcache's default
+# policy); tracking reads instead would turn every cache hit into a SQLite write
+AUTHOR_CACHE_SIZE = 256 * 1024 * 1024
+PAPER_CACHE_SIZE = 1024 * 1024 * 1024
+MISSING = object()
+
+# OpenAlex lookup outcomes stored with each cached author country
+OPENALEX_HIT = "hit"                # author found with a country
+OPENALEX_NO_COUNTRY = "no_country"  # author found, no institution country
+OPENALEX_MISS = "miss"              # no author matched the name
+OPENALEX_ERROR = "error"            # the request itself failed
+
 # Fix Unicode encoding issues for Windows console
 if sys.platform.startswith('win'):
     # Set console to UTF-8 encoding
     os.system('chcp 65001 >nul')
-    sys.stdout.reconfigure(encoding='utf-8')
-    sys.stderr.reconfigure(encoding='utf-8')
+    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+    sys.stderr.reconfigure(encoding='utf-8', errors='replace')
+else:
+    # Never fail on a character the console cannot show; streams replaced by a
+    # test runner or wrapper may not be TextIOWrappers
+    for stream in (sys.stdout, sys.stderr):
+        if hasattr(stream, 'reconfigure'):
+            stream.reconfigure(errors='replace')
 
 # Connect to DB
 conn = sqlite3.connect("DBLP.db")
 cursor = conn.cursor()
 
-# Query using the correct column names: 'name' (paper title) and 'authors'
-cursor.execute("SELECT name, authors FROM journal_papers")
-rows = cursor.fetchall()
+# Read-heavy settings: WAL so the scrapers can keep writing, a 64 MB page
+# cache and memory-mapped reads for the full-table scan
+cursor.execute("PRAGMA journal_mode=WAL")
+cursor.execute("PRAGMA synchronous=NORMAL")
+cursor.execute("PRAGMA cache_size=-65536")
+cursor.execute("PRAGMA temp_store=MEMORY")
+cursor.execute("PRAGMA mmap_size=268435456")
+
+# Column the first author's country of each processed paper is written to
+cursor.execute("SELECT 1 FROM pragma_table_info('journal_papers') WHERE name = 'first_author_country'")
+if cursor.fetchone() is None:
+    cursor.execute("ALTER TABLE journal_papers ADD COLUMN first_author_country TEXT")
+    conn.commit()
 
-# Filter rows with valid data
-valid_papers = [(title, authors) for title, authors in rows if title and authors]
+# Query using the correct column names: 'name' (paper title) and 'authors',
+# letting SQLite drop rows without a title or authors
+cursor.execute("""
+    SELECT rowid, name, authors FROM journal_papers
+    WHERE name IS NOT NULL AND name <> '' AND authors IS NOT NULL AND authors <> ''
+""")
+valid_papers = cursor.fetchall()
 
 print(f"Found {len(valid_papers)} papers with title and author information.")
 print(f"Sample data:")
-for i, (title, authors) in enumerate(valid_papers[:3]):
-    # Safe string handling for Unicode characters
-    safe_title = title.encode('ascii', 'ignore').decode('ascii') if title else "No title"
-    safe_authors = authors.encode('ascii', 'ignore').decode('ascii') if authors else "No authors"
-    print(f"  {i+1}. Title: {safe_title[:60]}...")
-    print(f"     Authors: {safe_authors[:80]}...")
+for i, (_, title, authors) in enumerate(valid_papers[:3]):
+    print(f"  {i+1}. Title: {title[:60]}...")
+    print(f"     Authors: {authors[:80]}...")
     print()
 
+# Affiliation keywords mapped to country codes. When several keywords occur
+# in one affiliation the earliest entry in this dict wins.
+COUNTRY_KEYWORDS = {
+    # South Asia
+    'india': 'IN', 'delhi': 'IN', 'mumbai': 'IN', 'bangalore': 'IN', 'chennai': 'IN', 
+    'hyderabad': 'IN', 'kolkata': 'IN', 'pune': 'IN', 'iit': 'IN', 'iisc': 'IN',
+    'indian institute': 'IN', 'nit': 'IN', 'bits': 'IN', 'anna university': 'IN',
+
+    'pakistan': 'PK', 'karachi': 'PK', 'lahore': 'PK', 'islamabad': 'PK', 
+    'rawalpindi': 'PK', 'faisalabad': 'PK', 'peshawar': 'PK', 'quetta': 'PK',
+    'multan': 'PK', 'gujranwala': 'PK', 'lums': 'PK', 'nust': 'PK', 'comsats': 'PK',
+
+    'bangladesh': 'BD', 'dhaka': 'BD', 'chittagong': 'BD', 'sylhet': 'BD',
+    'rajshahi': 'BD', 'buet': 'BD', 'du': 'BD',
+
+    'sri lanka': 'LK', 'colombo': 'LK', 'kandy': 'LK', 'moratuwa': 'LK',
+
+    'nepal': 'NP', 'kathmandu': 'NP', 'tribhuvan': 'NP',
+
+    # East Asia
+    'china': 'CN', 'beijing': 'CN', 'shanghai': 'CN', 'guangzhou': 'CN', 
+    'shenzhen': 'CN', 'hangzhou': 'CN', 'nanjing': 'CN', 'wuhan': 'CN',
+    'chengdu': 'CN', 'xi\'an': 'CN', 'tianjin': 'CN', 'tsinghua': 'CN', 
+    'peking': 'CN', 'fudan': 'CN', 'zhejiang': 'CN', 'sjtu': 'CN',
+    'chinese academy': 'CN', 'cas': 'CN', 'pku': 'CN',
+
+    'japan': 'JP', 'tokyo': 'JP', 'osaka': 'JP', 'kyoto': 'JP', 'nagoya': 'JP',
+    'yokohama': 'JP', 'kobe': 'JP', 'sendai': 'JP', 'sapporo': 'JP',
+    'todai': 'JP', 'kyodai': 'JP', 'waseda': 'JP', 'keio': 'JP',
+
+    'korea': 'KR', 'south korea': 'KR', 'seoul': 'KR', 'busan': 'KR', 
+    'incheon': 'KR', 'daegu': 'KR', 'kaist': 'KR', 'snu': 'KR', 
+    'yonsei': 'KR', 'postech': 'KR',
+
+    # Southeast Asia
+    'singapore': 'SG', 'nus': 'SG', 'ntu': 'SG', 'smu': 'SG',
+
+    'malaysia': 'MY', 'kuala lumpur': 'MY', 'johor': 'MY', 'penang': 'MY',
+    'um': 'MY', 'utm': 'MY', 'usm': 'MY', 'upm': 'MY',
+
+    'thailand': 'TH', 'bangkok': 'TH', 'chiang mai': 'TH', 'chulalongkorn': 'TH',
+
+    'indonesia': 'ID', 'jakarta': 'ID', 'bandung': 'ID', 'surabaya': 'ID',
+    'itb': 'ID', 'ui': 'ID', 'ugm': 'ID',
+
+    'philippines': 'PH', 'manila': 'PH', 'quezon': 'PH', 'up': 'PH', 'ateneo': 'PH',
+
+    'vietnam': 'VN', 'hanoi': 'VN', 'ho chi minh': 'VN', 'hcmc': 'VN',
+
+    # Middle East
+    'iran': 'IR', 'tehran': 'IR', 'isfahan': 'IR', 'mashhad': 'IR', 'shiraz': 'IR',
+    'sharif': 'IR', 'ut': 'IR',
+
+    'turkey': 'TR', 'istanbul': 'TR', 'ankara': 'TR', 'izmir': 'TR',
+    'bogazici': 'TR', 'metu': 'TR', 'bilkent': 'TR',
+
+    'israel': 'IL', 'tel aviv': 'IL', 'jerusalem': 'IL', 'haifa': 'IL',
+    'technion': 'IL', 'hebrew university': 'IL', 'weizmann': 'IL',
+
+    'saudi arabia': 'SA', 'riyadh': 'SA', 'jeddah': 'SA', 'kaust': 'SA',
+    'king saud': 'SA', 'kfupm': 'SA',
+
+    'uae': 'AE', 'dubai': 'AE', 'abu dhabi': 'AE', 'aub': 'AE',
+
+    # Europe
+    'united kingdom': 'GB', 'uk': 'GB', 'england': 'GB', 'britain': 'GB',
+    'cambridge': 'GB', 'oxford': 'GB', 'london': 'GB', 'manchester': 'GB',
+    'edinburgh': 'GB', 'glasgow': 'GB', 'bristol': 'GB', 'imperial': 'GB',
+    'ucl': 'GB', 'kcl': 'GB', 'lse': 'GB',
+
+    'germany': 'DE', 'berlin': 'DE', 'munich': 'DE', 'hamburg': 'DE',
+    'cologne': 'DE', 'frankfurt': 'DE', 'stuttgart': 'DE', 'dusseldorf': 'DE',
+    'max planck': 'DE', 'tum': 'DE', 'kit': 'DE', 'rwth': 'DE',
+
+    'france': 'FR', 'paris': 'FR', 'lyon': 'FR', 'marseille': 'FR',
+    'toulouse': 'FR', 'sorbonne': 'FR', 'inria': 'FR', 'cnrs': 'FR',
+
+    'italy': 'IT', 'rome': 'IT', 'milan': 'IT', 'naples': 'IT', 'turin': 'IT',
+    'bologna': 'IT', 'florence': 'IT', 'genoa': 'IT',
+
+    'spain': 'ES', 'madrid': 'ES', 'barcelona': 'ES', 'valencia': 'ES',
+    'seville': 'ES', 'upc': 'ES', 'uam': 'ES',
+
+    'netherlands': 'NL', 'amsterdam': 'NL', 'rotterdam': 'NL', 'utrecht': 'NL',
+    'delft': 'NL', 'eindhoven': 'NL', 'tue': 'NL',
+
+    'sweden': 'SE', 'stockholm': 'SE', 'gothenburg': 'SE', 'kth': 'SE',
+    'chalmers': 'SE', 'lund': 'SE',
+
+    'switzerland': 'CH', 'zurich': 'CH', 'geneva': 'CH', 'basel': 'CH',
+    'eth': 'CH', 'epfl': 'CH', 'cern': 'CH',
+
+    'russia': 'RU', 'moscow': 'RU', 'st petersburg': 'RU', 'saint petersburg': 'RU',
+    'novosibirsk': 'RU', 'msu': 'RU',
+
+    # North America
+    'united states': 'US', 'usa': 'US', 'america': 'US', 'u.s.': 'US',
+    'california': 'US', 'texas': 'US', 'new york': 'US', 'florida': 'US',
+    'mit': 'US', 'stanford': 'US', 'harvard': 'US', 'berkeley': 'US',
+    'caltech': 'US', 'princeton': 'US', 'yale': 'US', 'columbia': 'US',
+    'university of': 'US', 'state university': 'US', 'tech': 'US',
+
+    'canada': 'CA', 'toronto': 'CA', 'vancouver': 'CA', 'montreal': 'CA',
+    'calgary': 'CA', 'ottawa': 'CA', 'ubc': 'CA', 'mcgill': 'CA',
+    'waterloo': 'CA', 'uoft': 'CA',
+
+    # Oceania
+    'australia': 'AU', 'sydney': 'AU', 'melbourne': 'AU', 'brisbane': 'AU',
+    'perth': 'AU', 'adelaide': 'AU', 'unsw': 'AU', 'usyd': 'AU',
+    'unimelb': 'AU', 'anu': 'AU', 'monash': 'AU',
+
+    'new zealand': 'NZ', 'auckland': 'NZ', 'wellington': 'NZ', 'christchurch': 'NZ',
+
+    # Africa
+    'south africa': 'ZA', 'cape town': 'ZA', 'johannesburg': 'ZA', 'durban': 'ZA',
+    'uct': 'ZA', 'wits': 'ZA', 'stellenbosch': 'ZA',
+
+    'egypt': 'EG', 'cairo': 'EG', 'alexandria': 'EG', 'auc': 'EG',
+
+    # Latin America
+    'brazil': 'BR', 'sao paulo': 'BR', 'rio de janeiro': 'BR', 'brasilia': 'BR',
+    'usp': 'BR', 'unicamp': 'BR',
+
+    'mexico': 'MX', 'mexico city': 'MX', 'guadalajara': 'MX', 'monterrey': 'MX',
+    'unam': 'MX', 'itesm': 'MX',
+
+    'argentina': 'AR', 'buenos aires': 'AR', 'cordoba': 'AR', 'uba': 'AR',
+
+    'chile': 'CL', 'santiago': 'CL', 'valparaiso': 'CL', 'uc': 'CL',
+}
+
+COUNTRY_KEYWORDS_ITEMS = tuple(COUNTRY_KEYWORDS.items())
+
+# Every keyword carries its dict position so the earliest one still wins.
+# Plain one-word keywords are matched as whole words by intersecting with
+# the affiliation's tokens; phrases and punctuated keywords ("u.s.",
+# "xi'an") need a substring search
+WORD_RE = re.compile(r"[a-z]+")
+SINGLE_TOKEN_KEYWORDS = {
+    keyword: (index, country_code)
+    for index, (keyword, country_code) in enumerate(COUNTRY_KEYWORDS_ITEMS)
+    if WORD_RE.fullmatch(keyword)
+}
+PHRASE_KEYWORDS = tuple(
+    (index, keyword, country_code)
+    for index, (keyword, country_code) in enumerate(COUNTRY_KEYWORDS_ITEMS)
+    if keyword not in SINGLE_TOKEN_KEYWORDS
+)
+
+# Phrase keywords compiled into one automaton so an affiliation is scanned
+# in a single pass
+COUNTRY_AUTOMATON = None
+if ahocorasick is not None:
+    COUNTRY_AUTOMATON = ahocorasick.Automaton()
+    for index, keyword, country_code in PHRASE_KEYWORDS:
+        COUNTRY_AUTOMATON.add_word(keyword, (index, country_code))
+    COUNTRY_AUTOMATON.make_automaton()
+
+class TokenBucket:
+    """Semaphore that a background thread refills at a fixed rate"""
+    def __init__(self, rate):
+        self.tokens = threading.BoundedSemaphore(rate)
+        self.interval = 1.0 / rate
+        # Monotonic time before which the server asked us not to come back
+        self.resume_at = 0.0
+        self.lock = threading.Lock()
+        threading.Thread(target=self._refill, daemon=True).start()
+    
+    def _refill(self):
+        while True:
+            time.sleep(self.interval)
+            try:
+                self.tokens.release()
+            except ValueError:
+                # Bucket is already full
+                pass
+    
+    def acquire(self):
+        self.tokens.acquire()
+        delay = self.resume_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+    
+    def pause(self, seconds):
+        """Hold back every caller of this bucket for the given number of seconds"""
+        with self.lock:
+            self.resume_at = max(self.resume_at, time.monotonic() + seconds)
+
 class AuthorCountryLookup:
     def __init__(self):
-        self.paper_cache = {}
-        self.author_cache = {}
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Academic Research Script (mailto:research@example.com)',
-            'Accept': 'application/json'
-        })
+        self.paper_cache = diskcache.Cache(
+            "./.paper_cache",
+            size_limit=PAPER_CACHE_SIZE
+        )
+        self.author_cache = diskcache.Cache(
+            "./.author_cache",
+            size_limit=AUTHOR_CACHE_SIZE
+        )
+        self.cache_lock = threading.Lock()
+        # Authors whose OpenAlex request failed this run; kept in memory only so
+        # they are not retried for every paper but are asked about again next run
+        self.failed_authors = set()
+        # Author name -> Future for OpenAlex requests currently being made
+        self.in_flight = {}
+        # Local copy of OpenAlex author countries, filled by the opt-in
+        # preload_author_countries.py; absent unless that script has run
+        self.snapshot_db = sqlite3.connect("DBLP.db", check_same_thread=False)
+        self.snapshot_lock = threading.Lock()
+        self.has_snapshot = self.snapshot_db.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='author_country'"
+        ).fetchone() is not None
+        self.limiters = {
+            'api.openalex.org': TokenBucket(REQUESTS_PER_SECOND),
+            'api.semanticscholar.org': TokenBucket(REQUESTS_PER_SECOND)
+        }
+        # One HTTP/2 connection per host is shared by all worker threads. The
+        # pool settings live on the transport, which also retries failed
+        # connects; compressed responses are requested by default
+        self.client = httpx.Client(
+            headers={
+                'User-Agent': 'Academic Research Script (mailto:research@example.com)',
+                'Accept': 'application/json'
+            },
+            timeout=10.0,
+            transport=httpx.HTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                retries=MAX_RETRIES
+            )
+        )
     
     def clean_title(self, title):
         """Clean title for better matching"""
         return title.lower().strip()
     
-    def safe_print(self, text):
-        """Safely print text with Unicode characters"""
-        try:
-            print(text)
-        except UnicodeEncodeError:
-            # Remove non-ASCII characters if printing fails
-            safe_text = text.encode('ascii', 'ignore').decode('ascii')
-            print(safe_text)
+    def get(self, url, params=None):
+        """GET a URL once the host's token bucket allows it, retrying transient errors"""
+        limiter = self.limiters[urllib.parse.urlsplit(url).hostname]
+        for attempt in range(MAX_RETRIES + 1):
+            limiter.acquire()
+            response = self.client.get(url, params=params)
+            if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                return response
+            
+            # Rate-limited: wait as long as the server says, and make the other
+            # workers hitting this host wait too
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                limiter.pause(int(retry_after))
+            else:
+                time.sleep(RETRY_BACKOFF * 2 ** attempt)
+    
+    def get_country_from_snapshot(self, author_name):
+        """Look an author up in the preloaded author_country table"""
+        if not self.has_snapshot:
+            return None
+        with self.snapshot_lock:
+            row = self.snapshot_db.execute(
+                "SELECT country_code FROM author_country WHERE display_name_lower = ?",
+                (author_name.lower(),)
+            ).fetchone()
+        return row[0] if row else None
     
     def get_country_from_openalex(self, author_name):
-        """Get country from OpenAlex API"""
-        if author_name in self.author_cache:
-            return self.author_cache[author_name]
+        """Get (status, country) for an author from OpenAlex API"""
+        # The preloaded snapshot answers without touching the network
+        country_code = self.get_country_from_snapshot(author_name)
+        if country_code:
+            return (OPENALEX_HIT, country_code)
         
-        try:
-            encoded_name = urllib.parse.quote(author_name)
-            url = f"https://api.openalex.org/authors?search={encoded_name}&per-page=1"
+        with self.cache_lock:
+            # Single read so an entry cannot expire between a check and a get
+            cached = self.author_cache.get(author_name, MISSING)
+            if cached is not MISSING:
+                return cached
+            if author_name in self.failed_authors:
+                return (OPENALEX_ERROR, None)
             
-            response = self.session.get(url, timeout=10)
+            # Another worker is already asking about this author; wait for it
+            pending = self.in_flight.get(author_name)
+            if pending is None:
+                pending = self.in_flight[author_name] = Future()
+                owner = True
+            else:
+                owner = False
+        
+        if not owner:
+            return pending.result()
+        
+        result = (OPENALEX_ERROR, None)
+        try:
+            response = self.get(
+                "https://api.openalex.org/authors",
+                params={"search": author_name, "per-page": 1}
+            )
             response.raise_for_status()
             
             data = response.json()
             
             if 'results' in data and len(data['results']) > 0:
-                first_result = data['results'][0]
-                
-                # Try last_known_institution first
-                institution = first_result.get("last_known_institution")
-                if institution and institution.get("country_code"):
-                    country_code = institution.get("country_code")
-                    self.author_cache[author_name] = country_code
-                    return country_code
-                
-                # Try affiliations as backup
-                affiliations = first_result.get("affiliations", [])
-                for affiliation in affiliations:
-                    institution = affiliation.get("institution", {})
-                    if institution.get("country_code"):
-                        country_code = institution.get("country_code")
-                        self.author_cache[author_name] = country_code
-                        return country_code
+                country_code = self.country_from_openalex_result(data['results'][0])
+                if country_code:
+                    result = (OPENALEX_HIT, country_code)
+                else:
+                    result = (OPENALEX_NO_COUNTRY, None)
+            else:
+                result = (OPENALEX_MISS, None)
                         
         except Exception as e:
-            safe_name = author_name.encode('ascii', 'ignore').decode('ascii')
-            print(f"OpenAlex error for {safe_name}: {e}")
+            print(f"OpenAlex error for {author_name}: {e}")
+        
+        with self.cache_lock:
+            # A failed request says nothing about the author; keep it out of the
+            # persistent cache so the next run asks OpenAlex again
+            if result[0] == OPENALEX_ERROR:
+                self.failed_authors.add(author_name)
+            else:
+                self.author_cache.set(
+                    author_name, result,
+                    expire=CACHE_TTL if result[0] == OPENALEX_HIT else NEGATIVE_CACHE_TTL
+                )
+            del self.in_flight[author_name]
+        pending.set_result(result)
+        return result
+    
+    def country_from_openalex_result(self, result):
+        """Pick the country code out of one OpenAlex author record"""
+        # Try last_known_institution first
+        institution = result.get("last_known_institution")
+        if institution and institution.get("country_code"):
+            return institution.get("country_code")
+        
+        # Try affiliations as backup
+        affiliations = result.get("affiliations", [])
+        for affiliation in affiliations:
+            institution = affiliation.get("institution", {})
+            if institution.get("country_code"):
+                return institution.get("country_code")
         
-        self.author_cache[author_name] = None
         return None
     
-    def get_semantic_scholar_paper(self, title, authors):
+    def get_countries_batch(self, author_names):
+        """Resolve many authors with one OpenAlex request per OPENALEX_BATCH_SIZE names"""
+        countries = {}
+        pending = []
+        for author_name in dict.fromkeys(author_names):
+            country_code = self.get_country_from_snapshot(author_name)
+            if country_code:
+                countries[author_name] = country_code
+                continue
+            
+            with self.cache_lock:
+                cached = self.author_cache.get(author_name, MISSING)
+            if cached is not MISSING:
+                countries[author_name] = cached[1]
+            elif '|' not in author_name:
+                # '|' is the OR separator inside the filter value
+                pending.append(author_name)
+        
+        for start in range(0, len(pending), OPENALEX_BATCH_SIZE):
+            batch = pending[start:start + OPENALEX_BATCH_SIZE]
+            # Results carry no link to the name that matched them, so only exact
+            # display-name matches are taken; other names are left uncached for
+            # get_country_from_openalex to search one at a time
+            wanted = {author_name.lower(): author_name for author_name in batch}
+            try:
+                response = self.get(
+                    "https://api.openalex.org/authors",
+                    params={
+                        "filter": "display_name.search:" + '|'.join(batch),
+                        "sort": "works_count:desc",
+                        "per-page": 200
+                    }
+                )
+                response.raise_for_status()
+                
+                for result in response.json().get('results', []):
+                    author_name = wanted.pop((result.get('display_name') or '').lower(), None)
+                    if author_name is None:
+                        continue
+                    country_code = self.country_from_openalex_result(result)
+                    if country_code:
+                        with self.cache_lock:
+                            self.author_cache.set(author_name, (OPENALEX_HIT, country_code), expire=CACHE_TTL)
+                        countries[author_name] = country_code
+                        
+            except Exception as e:
+                print(f"OpenAlex batch error for {len(batch)} authors: {e}")
+        
+        return countries
+    
+    def get_semantic_scholar_paper(self, title, first_author):
         """Query Semantic Scholar API for paper details"""
         clean_title = self.clean_title(title)
         cache_key = f"ss_{clean_title}"
         
-        if cache_key in self.paper_cache:
-            return self.paper_cache[cache_key]
+        with self.cache_lock:
+            cached = self.paper_cache.get(cache_key, MISSING)
+            if cached is not MISSING:
+                return cached
         
+        match = None
         try:
             # Construct a query with both title and first author
-            first_author = authors[0] if authors else ""
-            query = f"{title} {first_author}"
-            encoded_query = quote(query)
-            
-            url = f"https://api.semanticscholar.org/graph/v1/paper/search?query={encoded_query}&fields=title,authors,year,venue,openAccessPdf"
-            
-            response = self.session.get(url, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                # Find the best matching paper
-                if 'data' in data and data['data']:
-                    for paper in data['data']:
-                        # Simple match: check if the paper title contains our search title
-                        # or vice versa (for cases where our title contains extraneous info)
-                        paper_title = paper.get('title', '').lower()
-                        if paper_title in clean_title or clean_title in paper_title:
-                            self.paper_cache[cache_key] = paper
-                            return paper
-            
-            # If no paper found
-            self.paper_cache[cache_key] = None
-            return None
+            response = self.get(
+                "https://api.semanticscholar.org/graph/v1/paper/search",
+                params={
+                    "query": f"{title} {first_author}",
+                    "fields": "title,authors,year,venue,openAccessPdf"
+                }
+            )
+            if response.status_code != 200:
+                # Rate limits and server errors are not answers; leave them uncached
+                return None
+            data = response.json()
+            # Find the best matching paper
+            if 'data' in data and data['data']:
+                # Lowercase each candidate title once; untitled results are
+                # skipped since '' is a substring of every title
+                candidates = [(paper, (paper.get('title') or '').lower()) for paper in data['data']]
+                for paper, paper_title in candidates:
+                    # Simple match: check if the paper title contains our search title
+                    # or vice versa (for cases where our title contains extraneous info)
+                    if paper_title and (paper_title in clean_title or clean_title in paper_title):
+                        match = paper
+                        break
             
         except Exception as e:
-            safe_title = title.encode('ascii', 'ignore').decode('ascii') if title else "Unknown"
-            print(f"Semantic Scholar error for {safe_title}: {e}")
-            self.paper_cache[cache_key] = None
+            print(f"Semantic Scholar error for {title}: {e}")
             return None
+        
+        with self.cache_lock:
+            self.paper_cache.set(
+                cache_key, match,
+                expire=CACHE_TTL if match else NEGATIVE_CACHE_TTL
+            )
+        return match
     
     def extract_country_from_semantic_scholar(self, paper):
         """Extract country information from Semantic Scholar paper data"""
@@ -149,164 +541,45 @@ class AuthorCountryLookup:
                 for affiliation in author['affiliations']:
                     # Look for country information in affiliation name
                     affiliation_name = affiliation.lower()
+                    tokens = set(WORD_RE.findall(affiliation_name))
                     
-                    # Simple country detection from affiliation text
-                    country_keywords = {
-                        # South Asia
-                        'india': 'IN', 'delhi': 'IN', 'mumbai': 'IN', 'bangalore': 'IN', 'chennai': 'IN', 
-                        'hyderabad': 'IN', 'kolkata': 'IN', 'pune': 'IN', 'iit': 'IN', 'iisc': 'IN',
-                        'indian institute': 'IN', 'nit': 'IN', 'bits': 'IN', 'anna university': 'IN',
-                        
-                        'pakistan': 'PK', 'karachi': 'PK', 'lahore': 'PK', 'islamabad': 'PK', 
-                        'rawalpindi': 'PK', 'faisalabad': 'PK', 'peshawar': 'PK', 'quetta': 'PK',
-                        'multan': 'PK', 'gujranwala': 'PK', 'lums': 'PK', 'nust': 'PK', 'comsats': 'PK',
-                        
-                        'bangladesh': 'BD', 'dhaka': 'BD', 'chittagong': 'BD', 'sylhet': 'BD',
-                        'rajshahi': 'BD', 'buet': 'BD', 'du': 'BD',
-                        
-                        'sri lanka': 'LK', 'colombo': 'LK', 'kandy': 'LK', 'moratuwa': 'LK',
-                        
-                        'nepal': 'NP', 'kathmandu': 'NP', 'tribhuvan': 'NP',
-                        
-                        # East Asia
-                        'china': 'CN', 'beijing': 'CN', 'shanghai': 'CN', 'guangzhou': 'CN', 
-                        'shenzhen': 'CN', 'hangzhou': 'CN', 'nanjing': 'CN', 'wuhan': 'CN',
-                        'chengdu': 'CN', 'xi\'an': 'CN', 'tianjin': 'CN', 'tsinghua': 'CN', 
-                        'peking': 'CN', 'fudan': 'CN', 'zhejiang': 'CN', 'sjtu': 'CN',
-                        'chinese academy': 'CN', 'cas': 'CN', 'pku': 'CN',
-                        
-                        'japan': 'JP', 'tokyo': 'JP', 'osaka': 'JP', 'kyoto': 'JP', 'nagoya': 'JP',
-                        'yokohama': 'JP', 'kobe': 'JP', 'sendai': 'JP', 'sapporo': 'JP',
-                        'todai': 'JP', 'kyodai': 'JP', 'waseda': 'JP', 'keio': 'JP',
-                        
-                        'korea': 'KR', 'south korea': 'KR', 'seoul': 'KR', 'busan': 'KR', 
-                        'incheon': 'KR', 'daegu': 'KR', 'kaist': 'KR', 'snu': 'KR', 
-                        'yonsei': 'KR', 'postech': 'KR',
-                        
-                        # Southeast Asia
-                        'singapore': 'SG', 'nus': 'SG', 'ntu': 'SG', 'smu': 'SG',
-                        
-                        'malaysia': 'MY', 'kuala lumpur': 'MY', 'johor': 'MY', 'penang': 'MY',
-                        'um': 'MY', 'utm': 'MY', 'usm': 'MY', 'upm': 'MY',
-                        
-                        'thailand': 'TH', 'bangkok': 'TH', 'chiang mai': 'TH', 'chulalongkorn': 'TH',
-                        
-                        'indonesia': 'ID', 'jakarta': 'ID', 'bandung': 'ID', 'surabaya': 'ID',
-                        'itb': 'ID', 'ui': 'ID', 'ugm': 'ID',
-                        
-                        'philippines': 'PH', 'manila': 'PH', 'quezon': 'PH', 'up': 'PH', 'ateneo': 'PH',
-                        
-                        'vietnam': 'VN', 'hanoi': 'VN', 'ho chi minh': 'VN', 'hcmc': 'VN',
-                        
-                        # Middle East
-                        'iran': 'IR', 'tehran': 'IR', 'isfahan': 'IR', 'mashhad': 'IR', 'shiraz': 'IR',
-                        'sharif': 'IR', 'ut': 'IR',
-                        
-                        'turkey': 'TR', 'istanbul': 'TR', 'ankara': 'TR', 'izmir': 'TR',
-                        'bogazici': 'TR', 'metu': 'TR', 'bilkent': 'TR',
-                        
-                        'israel': 'IL', 'tel aviv': 'IL', 'jerusalem': 'IL', 'haifa': 'IL',
-                        'technion': 'IL', 'hebrew university': 'IL', 'weizmann': 'IL',
-                        
-                        'saudi arabia': 'SA', 'riyadh': 'SA', 'jeddah': 'SA', 'kaust': 'SA',
-                        'king saud': 'SA', 'kfupm': 'SA',
-                        
-                        'uae': 'AE', 'dubai': 'AE', 'abu dhabi': 'AE', 'aub': 'AE',
-                        
-                        # Europe
-                        'united kingdom': 'GB', 'uk': 'GB', 'england': 'GB', 'britain': 'GB',
-                        'cambridge': 'GB', 'oxford': 'GB', 'london': 'GB', 'manchester': 'GB',
-                        'edinburgh': 'GB', 'glasgow': 'GB', 'bristol': 'GB', 'imperial': 'GB',
-                        'ucl': 'GB', 'kcl': 'GB', 'lse': 'GB',
-                        
-                        'germany': 'DE', 'berlin': 'DE', 'munich': 'DE', 'hamburg': 'DE',
-                        'cologne': 'DE', 'frankfurt': 'DE', 'stuttgart': 'DE', 'dusseldorf': 'DE',
-                        'max planck': 'DE', 'tum': 'DE', 'kit': 'DE', 'rwth': 'DE',
-                        
-                        'france': 'FR', 'paris': 'FR', 'lyon': 'FR', 'marseille': 'FR',
-                        'toulouse': 'FR', 'sorbonne': 'FR', 'inria': 'FR', 'cnrs': 'FR',
-                        
-                        'italy': 'IT', 'rome': 'IT', 'milan': 'IT', 'naples': 'IT', 'turin': 'IT',
-                        'bologna': 'IT', 'florence': 'IT', 'genoa': 'IT',
-                        
-                        'spain': 'ES', 'madrid': 'ES', 'barcelona': 'ES', 'valencia': 'ES',
-                        'seville': 'ES', 'upc': 'ES', 'uam': 'ES',
-                        
-                        'netherlands': 'NL', 'amsterdam': 'NL', 'rotterdam': 'NL', 'utrecht': 'NL',
-                        'delft': 'NL', 'eindhoven': 'NL', 'tue': 'NL',
-                        
-                        'sweden': 'SE', 'stockholm': 'SE', 'gothenburg': 'SE', 'kth': 'SE',
-                        'chalmers': 'SE', 'lund': 'SE',
-                        
-                        'switzerland': 'CH', 'zurich': 'CH', 'geneva': 'CH', 'basel': 'CH',
-                        'eth': 'CH', 'epfl': 'CH', 'cern': 'CH',
-                        
-                        'russia': 'RU', 'moscow': 'RU', 'st petersburg': 'RU', 'saint petersburg': 'RU',
-                        'novosibirsk': 'RU', 'msu': 'RU',
-                        
-                        # North America
-                        'united states': 'US', 'usa': 'US', 'america': 'US', 'u.s.': 'US',
-                        'california': 'US', 'texas': 'US', 'new york': 'US', 'florida': 'US',
-                        'mit': 'US', 'stanford': 'US', 'harvard': 'US', 'berkeley': 'US',
-                        'caltech': 'US', 'princeton': 'US', 'yale': 'US', 'columbia': 'US',
-                        'university of': 'US', 'state university': 'US', 'tech': 'US',
-                        
-                        'canada': 'CA', 'toronto': 'CA', 'vancouver': 'CA', 'montreal': 'CA',
-                        'calgary': 'CA', 'ottawa': 'CA', 'ubc': 'CA', 'mcgill': 'CA',
-                        'waterloo': 'CA', 'uoft': 'CA',
-                        
-                        # Oceania
-                        'australia': 'AU', 'sydney': 'AU', 'melbourne': 'AU', 'brisbane': 'AU',
-                        'perth': 'AU', 'adelaide': 'AU', 'unsw': 'AU', 'usyd': 'AU',
-                        'unimelb': 'AU', 'anu': 'AU', 'monash': 'AU',
-                        
-                        'new zealand': 'NZ', 'auckland': 'NZ', 'wellington': 'NZ', 'christchurch': 'NZ',
-                        
-                        # Africa
-                        'south africa': 'ZA', 'cape town': 'ZA', 'johannesburg': 'ZA', 'durban': 'ZA',
-                        'uct': 'ZA', 'wits': 'ZA', 'stellenbosch': 'ZA',
-                        
-                        'egypt': 'EG', 'cairo': 'EG', 'alexandria': 'EG', 'auc': 'EG',
-                        
-                        # Latin America
-                        'brazil': 'BR', 'sao paulo': 'BR', 'rio de janeiro': 'BR', 'brasilia': 'BR',
-                        'usp': 'BR', 'unicamp': 'BR',
-                        
-                        'mexico': 'MX', 'mexico city': 'MX', 'guadalajara': 'MX', 'monterrey': 'MX',
-                        'unam': 'MX', 'itesm': 'MX',
-                        
-                        'argentina': 'AR', 'buenos aires': 'AR', 'cordoba': 'AR', 'uba': 'AR',
-                        
-                        'chile': 'CL', 'santiago': 'CL', 'valparaiso': 'CL', 'uc': 'CL',
-                    }
-                    for keyword, country_code in country_keywords.items():
-                        if keyword in affiliation_name:
-                            return country_code
+                    matches = [SINGLE_TOKEN_KEYWORDS[token] for token in tokens & SINGLE_TOKEN_KEYWORDS.keys()]
+                    if COUNTRY_AUTOMATON is not None:
+                        matches.extend(value for _, value in COUNTRY_AUTOMATON.iter(affiliation_name))
+                    else:
+                        matches.extend((index, country_code) for index, keyword, country_code in PHRASE_KEYWORDS
+                                       if keyword in affiliation_name)
+                    if matches:
+                        return min(matches)[1]
         
         return None
     
     def get_author_country(self, title, authors_str):
         """Get country for first author using multiple methods"""
-        authors = [author.strip() for author in authors_str.split(',')]
-        first_author = authors[0] if authors else ""
+        first_author = authors_str.split(',', 1)[0].strip()
         
         if not first_author:
             return None
         
         # Method 1: Try OpenAlex for the author
-        country = self.get_country_from_openalex(first_author)
+        status, country = self.get_country_from_openalex(first_author)
         if country:
             return country
         
+        # OpenAlex answered and knows no such author, so a paper search will
+        # not turn up an affiliation either
+        if status == OPENALEX_MISS:
+            return None
+        
         # Method 2: Try Semantic Scholar with paper title and authors
-        safe_author = first_author.encode('ascii', 'ignore').decode('ascii')
-        print(f"  Trying Semantic Scholar for: {safe_author}")
-        paper = self.get_semantic_scholar_paper(title, authors)
+        print(f"  Trying Semantic Scholar for: {first_author}")
+        paper = self.get_semantic_scholar_paper(title, first_author)
         if paper:
             country = self.extract_country_from_semantic_scholar(paper)
             if country:
                 # Cache this result for the author
-                self.author_cache[first_author] = country
+                with self.cache_lock:
+                    self.author_cache.set(first_author, (OPENALEX_HIT, country), expire=CACHE_TTL)
                 return country
         
         return None
@@ -349,24 +622,66 @@ total_lookups = 0
 # Test with limited sample first
 test_limit = 114767  # Adjust as needed
 
-for i, (title, authors_str) in enumerate(valid_papers[:test_limit]):
-    # Safe handling of Unicode characters in titles
-    safe_title = title.encode('ascii', 'ignore').decode('ascii') if title else "No title"
-    print(f"\n{i+1}/{test_limit}. Processing paper: {safe_title[:50]}...")
+executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+
+# Look up each distinct first author once before the per-paper pass, in bulk
+# where OpenAlex can match names exactly and one by one for the rest, so
+# that the paper loop mostly hits the cache
+unique_first_authors = {authors_str.split(',', 1)[0].strip() for _, _, authors_str in valid_papers[:test_limit]}
+unique_first_authors.discard("")
+
+author_names = list(unique_first_authors)
+batches = [author_names[start:start + OPENALEX_BATCH_SIZE]
+           for start in range(0, len(author_names), OPENALEX_BATCH_SIZE)]
+prefetched = {}
+for countries in executor.map(lookup.get_countries_batch, batches):
+    prefetched.update(countries)
+print(f"Prefetched {len(prefetched)}/{len(author_names)} author countries from OpenAlex")
+
+list(executor.map(lookup.get_country_from_openalex, unique_first_authors.difference(prefetched)))
+
+def lookup_paper(title, authors_str):
+    """Resolve the first author's country for one paper (runs in a worker thread)"""
+    first_author = authors_str.split(',', 1)[0].strip()
+    
+    if not first_author:
+        return first_author, None
+    
+    # Get country using combined approach
+    return first_author, lookup.get_author_country(title, authors_str)
+
+def save_first_author_countries(rows):
+    """Write a batch of (country_code, rowid) pairs back to journal_papers in one transaction"""
+    if not rows:
+        return
+    cursor.execute("BEGIN")
+    cursor.executemany("UPDATE journal_papers SET first_author_country = ? WHERE rowid = ?", rows)
+    conn.commit()
+
+country_updates = []
+
+# Lookups run concurrently, but results are consumed in input order so the
+# country lists and the no-country CSV come out the same on every run
+futures = [
+    (i, paper_id, title, authors_str, executor.submit(lookup_paper, title, authors_str))
+    for i, (paper_id, title, authors_str) in enumerate(valid_papers[:test_limit])
+]
+
+for i, paper_id, title, authors_str, future in futures:
+    first_author, country_code = future.result()
     
-    authors = [author.strip() for author in authors_str.split(',')]
-    first_author = authors[0] if authors else ""
+    print(f"\n{i+1}/{test_limit}. Processing paper: {title[:50]}...")
     
     if not first_author:
         continue
     
-    # Safe handling of Unicode characters in author names    
-    safe_author = first_author.encode('ascii', 'ignore').decode('ascii')
-    print(f"  First author: {safe_author}")
+    print(f"  First author: {first_author}")
     total_lookups += 1
     
-    # Get country using combined approach
-    country_code = lookup.get_author_country(title, authors_str)
+    country_updates.append((country_code, paper_id))
+    if len(country_updates) >= UPDATE_BATCH_SIZE:
+        save_first_author_countries(country_updates)
+        country_updates = []
     
     if country_code:
         successful_lookups += 1
@@ -388,13 +703,9 @@ for i, (title, authors_str) in enumerate(valid_papers[:test_limit]):
             'all_authors': authors_str
         })
         print(f" No country found")
-    
-    # Rate limiting - be nice to APIs
-    if i % 10 == 0 and i > 0:
-        print(f"  ... Processed {i} papers, taking a short break...")
-        time.sleep(2)
-    else:
-        time.sleep(0.2)
+
+executor.shutdown()
+save_first_author_countries(country_updates)
 
 # Results summary
 print(f"\n" + "="*60)
@@ -408,26 +719,23 @@ for country, papers in country_papers.items():
         print(f"\n{country}: {len(papers)} papers")
         print("-" * (len(country) + 20))
         for j, paper in enumerate(papers[:5], 1):  # Show first 5 papers as sample
-            safe_title = paper['title'].encode('ascii', 'ignore').decode('ascii')
-            safe_author = paper['author'].encode('ascii', 'ignore').decode('ascii')
-            print(f"  {j}. {safe_title[:60]}... (Author: {safe_author})")
+            print(f"  {j}. {paper['title'][:60]}... (Author: {paper['author']})")
         if len(papers) > 5:
             print(f"  ... and {len(papers) - 5} more papers")
 
 # Create CSV for authors with no country found
 if authors_no_country:
     csv_filename = "authors_no_country_found.csv"
-    with open(csv_filename, 'w', newline='', encoding='utf-8') as csvfile:
+    with open(csv_filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
         fieldnames = ['Author Name', 'Paper Title', 'All Authors']
         writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
         
         writer.writeheader()
-        for entry in authors_no_country:
-            writer.writerow({
-                'Author Name': entry['author'],
-                'Paper Title': entry['title'],
-                'All Authors': entry['all_authors']
-            })
+        writer.writerows({
+            'Author Name': entry['author'],
+            'Paper Title': entry['title'],
+            'All Authors': entry['all_authors']
+        } for entry in authors_no_country)
     
     print(f"\n Created CSV file '{csv_filename}' with {len(authors_no_country)} authors where no country was found")
 else:
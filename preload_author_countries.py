@@ -0,0 +1,176 @@
+import sqlite3
+import sys
+import zlib
+import httpx
+import ijson
+import logging
+# Set up logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DB_PATH = 'DBLP.db'
+# OpenAlex publishes its authors snapshot as gzipped JSON-lines parts on a public S3 bucket
+OPENALEX_MANIFEST_URL = 'https://openalex.s3.amazonaws.com/data/authors/manifest'
+OPENALEX_S3_PREFIX = 's3://openalex/'
+OPENALEX_HTTPS_PREFIX = 'https://openalex.s3.amazonaws.com/'
+INSERT_BATCH_SIZE = 5000  # Rows per executemany transaction
+
+# One row per lowercased display name; when several OpenAlex authors share a name the one
+# with the most works wins, which is also who the API search ranks first
+CREATE_AUTHOR_COUNTRY_TABLE = """
+    CREATE TABLE IF NOT EXISTS author_country (
+        display_name_lower TEXT NOT NULL,
+        country_code TEXT NOT NULL,
+        works_count INTEGER NOT NULL DEFAULT 0
+    )
+"""
+CREATE_AUTHOR_COUNTRY_INDEX = """
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_author_country_name
+    ON author_country(display_name_lower)
+"""
+UPSERT_AUTHOR_COUNTRY_QUERY = """
+    INSERT INTO author_country (display_name_lower, country_code, works_count)
+    VALUES (?, ?, ?)
+    ON CONFLICT(display_name_lower) DO UPDATE SET
+        country_code = excluded.country_code,
+        works_count = excluded.works_count
+    WHERE excluded.works_count > author_country.works_count
+"""
+
+def load_first_author_names(conn):
+    """Collect the lowercased first author of every stored paper.
+    
+    Only these names are kept from the snapshot, which shrinks tens of millions of
+    OpenAlex authors down to the ones the country scripts will actually look up.
+    
+    Args:
+        conn: Open connection to the DBLP database
+    
+    Returns:
+        Set of lowercased first-author names
+    """
+    tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+    names = set()
+    for table in ('conf_papers', 'journal_papers'):
+        if table not in tables:
+            continue
+        for (authors,) in conn.execute(f"SELECT authors FROM {table} WHERE authors IS NOT NULL AND authors <> ''"):
+            name = authors.split(',', 1)[0].strip().lower()
+            if name:
+                names.add(name)
+    return names
+
+def author_country(record):
+    """Pick the country code out of one OpenAlex author record.
+    
+    Args:
+        record: Author object from the snapshot
+    
+    Returns:
+        Two-letter country code, or None if no institution carries one
+    """
+    # Current snapshots list last_known_institutions; older ones have a single object
+    institutions = record.get('last_known_institutions') or [record.get('last_known_institution') or {}]
+    for institution in institutions:
+        if institution and institution.get('country_code'):
+            return institution['country_code']
+    
+    for affiliation in record.get('affiliations') or []:
+        institution = affiliation.get('institution') or {}
+        if institution.get('country_code'):
+            return institution['country_code']
+    return None
+
+def stream_authors(client, url):
+    """Yield author records from one gzipped snapshot part without holding it in memory.
+    
+    Args:
+        client: httpx client used for the download
+        url: HTTPS URL of the part file
+    
+    Yields:
+        One dict per author
+    """
+    records = ijson.sendable_list()
+    parser = ijson.items_coro(records, '', multiple_values=True)
+    decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+    with client.stream('GET', url) as response:
+        response.raise_for_status()
+        for chunk in response.iter_raw():
+            data = decompressor.decompress(chunk)
+            # A part may consist of several concatenated gzip members
+            while decompressor.eof and decompressor.unused_data:
+                rest = decompressor.unused_data
+                decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+                data += decompressor.decompress(rest)
+            # An empty send tells ijson the input has ended; the decompressor often
+            # returns nothing while it is still buffering a gzip header
+            if data:
+                parser.send(data)
+            yield from records
+            del records[:]
+    parser.close()
+    yield from records
+
+def save_rows(conn, rows):
+    """Upsert a batch of (name, country_code, works_count) rows in one transaction"""
+    if not rows:
+        return
+    with conn:
+        conn.execute("BEGIN")
+        conn.executemany(UPSERT_AUTHOR_COUNTRY_QUERY, rows)
+
+def preload_author_countries(db_path=DB_PATH, max_parts=None):
+    """Fill the author_country table from the OpenAlex authors snapshot.
+    
+    Args:
+        db_path: Path to the DBLP database
+        max_parts: Only read this many snapshot parts (None reads all of them)
+    """
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(CREATE_AUTHOR_COUNTRY_TABLE)
+    conn.execute(CREATE_AUTHOR_COUNTRY_INDEX)
+    
+    wanted = load_first_author_names(conn)
+    if not wanted:
+        logger.error("No papers with authors in the database; run the scrapers first")
+        conn.close()
+        return
+    logger.info(f"Looking for {len(wanted)} first authors in the OpenAlex snapshot")
+    
+    try:
+        with httpx.Client(timeout=60.0, follow_redirects=True) as client:
+            response = client.get(OPENALEX_MANIFEST_URL)
+            response.raise_for_status()
+            entries = response.json()['entries'][:max_parts]
+            for part_number, entry in enumerate(entries, 1):
+                url = entry['url'].replace(OPENALEX_S3_PREFIX, OPENALEX_HTTPS_PREFIX, 1)
+                rows = []
+                stored = 0
+                for record in stream_authors(client, url):
+                    name = (record.get('display_name') or '').lower()
+                    if name not in wanted:
+                        continue
+                    country_code = author_country(record)
+                    if country_code:
+                        rows.append((name, country_code, record.get('works_count') or 0))
+                    if len(rows) >= INSERT_BATCH_SIZE:
+                        save_rows(conn, rows)
+                        stored += len(rows)
+                        rows = []
+                save_rows(conn, rows)
+                stored += len(rows)
+                logger.info(f"Part {part_number}/{len(entries)}: stored {stored} author countries from {url}")
+        
+        count = conn.execute("SELECT COUNT(*) FROM author_country").fetchone()[0]
+        logger.info(f"author_country now holds {count} names")
+    except Exception as e:
+        logger.error(f"Error preloading author countries: {e}")
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    # python preload_author_countries.py [max_parts]
+    preload_author_countries(max_parts=int(sys.argv[1]) if len(sys.argv) > 1 else None)
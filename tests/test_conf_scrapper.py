@@ -0,0 +1,124 @@
+import gzip
+import os
+import queue
+import sqlite3
+import tempfile
+import unittest
+
+from selectolax.parser import HTMLParser
+
+from conf_scrapper import DBLPScraper
+
+DUMP_DTD = """<!ELEMENT dblp (inproceedings)*>
+<!ENTITY uuml "&#252;">
+"""
+
+DUMP_XML = """<?xml version="1.0" encoding="ISO-8859-1"?>
+<!DOCTYPE dblp SYSTEM "dblp.dtd">
+<dblp>
+<inproceedings key="conf/icse/Muller20">
+<author>Hans M&uuml;ller</author>
+<author>Jane Doe</author>
+<title>Gr&uuml;ndliche Tests.</title>
+<pages>1-10</pages>
+<year>2020</year>
+<url>db/conf/icse/icse2020.html#Muller20</url>
+</inproceedings>
+<inproceedings key="conf/other/Skip20">
+<author>Someone Else</author>
+<title>Not tracked.</title>
+<year>2020</year>
+</inproceedings>
+</dblp>
+"""
+
+
+class ImportFromDumpTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        with open(os.path.join(self.tmp.name, 'dblp.dtd'), 'w') as dtd:
+            dtd.write(DUMP_DTD)
+        self.dump_path = os.path.join(self.tmp.name, 'dblp.xml.gz')
+        with gzip.open(self.dump_path, 'wb') as dump:
+            dump.write(DUMP_XML.encode('iso-8859-1'))
+
+        # Skip __init__: no database or writer thread is needed to parse the dump
+        self.scraper = DBLPScraper.__new__(DBLPScraper)
+        self.scraper.write_q = queue.Queue()
+        self.scraper.get_conference_venues = lambda: {'conf/icse': 'ICSE'}
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_reads_gzipped_dump_and_resolves_dtd_entities(self):
+        imported = self.scraper.import_from_dump(self.dump_path)
+
+        self.assertEqual(imported, 1)
+        paper = self.scraper.write_q.get_nowait()
+        self.assertEqual(paper['name'], 'Gründliche Tests.')
+        self.assertEqual(paper['authors'], 'Hans Müller, Jane Doe')
+        self.assertEqual(paper['conference_processed'], 'ICSE')
+        self.assertEqual(paper['year'], '2020')
+        self.assertTrue(self.scraper.write_q.empty())
+
+
+class CreatedAtTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, 'DBLP.db')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def insert_into(self, created_at_definition):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(f"CREATE TABLE conf_papers (name TEXT, authors TEXT, conference_href TEXT, "
+                     f"paper_href TEXT, year TEXT, isbn TEXT, pages TEXT, conference_location TEXT, "
+                     f"{created_at_definition}, conference_processed TEXT, edition_name TEXT)")
+        conn.close()
+
+        scraper = DBLPScraper(self.db_path)
+        scraper.write_q.put({'name': 'A paper.', 'paper_href': 'https://dblp.org/rec/conf/icse/A20.html'})
+        scraper.close()
+
+        conn = sqlite3.connect(self.db_path)
+        rows = conn.execute("SELECT name, created_at FROM conf_papers").fetchall()
+        conn.close()
+        return rows
+
+    def test_parenthesised_default_is_left_alone(self):
+        rows = self.insert_into("created_at TEXT DEFAULT (datetime('now'))")
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0][0], 'A paper.')
+        self.assertTrue(rows[0][1])
+
+    def test_sized_column_type_without_default(self):
+        rows = self.insert_into("created_at VARCHAR(32)")
+        self.assertEqual(len(rows), 1)
+        self.assertTrue(rows[0][1])
+
+
+class ExtractPaperDataTest(unittest.TestCase):
+    def setUp(self):
+        self.scraper = DBLPScraper.__new__(DBLPScraper)
+
+    def extract(self, cite_text):
+        html = f'<li class="entry inproceedings"><cite>{cite_text}</cite></li>'
+        element = HTMLParser(html).css_first('li')
+        return self.scraper.extract_paper_data(element, 'ICSE', 'https://dblp.org/db/conf/icse/icse2020.html')
+
+    def test_year_inside_page_range_is_still_the_year(self):
+        paper = self.extract("Hans Muller: A title. Proc. pp. 1999-2005, Berlin, Germany, 2020")
+        self.assertEqual(paper['year'], '1999')
+        self.assertEqual(paper['pages'], '1999-2005')
+        self.assertEqual(paper['conference_location'], 'Berlin, Germany, 2020')
+
+    def test_pages_word_and_country_location(self):
+        paper = self.extract("Jane Doe: Other. ICSE 2020: pages 12-20, Austin, TX, USA")
+        self.assertEqual(paper['year'], '2020')
+        self.assertEqual(paper['pages'], '12-20')
+        self.assertEqual(paper['conference_location'], 'Austin, TX, USA')
+
+
+if __name__ == '__main__':
+    unittest.main()
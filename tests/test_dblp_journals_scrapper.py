@@ -0,0 +1,36 @@
+import unittest
+
+from dblp_journals_scrapper import parse_paper
+
+JOURNAL = {'name': 'ACM Trans. Database Syst.'}
+
+
+def parse(entry_text, volume_info=None):
+    html = f'<li class="entry article"><span class="title">A title.</span> {entry_text}</li>'
+    return parse_paper(html.encode('utf-8'), JOURNAL, volume_info)
+
+
+class ParsePaperMetadataTest(unittest.TestCase):
+    def test_pages_overlapping_the_volume(self):
+        paper = parse("Vol. 12-14 (2020)")
+        self.assertEqual(paper['volume'], '12')
+        self.assertEqual(paper['pages'], '12-14')
+        self.assertEqual(paper['year'], '2020')
+
+    def test_pages_overlapping_the_issue(self):
+        paper = parse("No 3-5 2019")
+        self.assertEqual(paper['issue'], '3')
+        self.assertEqual(paper['pages'], '3-5')
+        self.assertEqual(paper['year'], '2019')
+
+    def test_volume_info_wins_over_paper_text(self):
+        paper = parse("48(2): 101-130 (2023) doi:10.1145/3583230", {'volume': '48', 'year': '2023'})
+        self.assertEqual(paper['volume'], '48')
+        self.assertEqual(paper['year'], '2023')
+        self.assertEqual(paper['pages'], '101-130')
+        self.assertEqual(paper['doi'], '10.1145/3583230')
+        self.assertEqual(paper['journal_name'], JOURNAL['name'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import gzip
+import json
+import unittest
+
+from preload_author_countries import stream_authors
+
+AUTHORS = [
+    {'display_name': 'Hans M\u00fcller', 'works_count': 12, 'last_known_institutions': [{'country_code': 'DE'}]},
+    {'display_name': 'Jane Doe', 'works_count': 3, 'affiliations': [{'institution': {'country_code': 'US'}}]},
+    {'display_name': 'Ana Silva', 'works_count': 7, 'last_known_institution': {'country_code': 'PT'}},
+]
+
+
+class FakeResponse:
+    def __init__(self, body, chunk_size):
+        self.body = body
+        self.chunk_size = chunk_size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_raw(self):
+        for start in range(0, len(self.body), self.chunk_size):
+            yield self.body[start:start + self.chunk_size]
+
+
+class FakeClient:
+    def __init__(self, body, chunk_size):
+        self.response = FakeResponse(body, chunk_size)
+
+    def stream(self, method, url):
+        return self.response
+
+
+def json_lines(records):
+    return ''.join(json.dumps(record) + '\n' for record in records).encode('utf-8')
+
+
+class StreamAuthorsTest(unittest.TestCase):
+    def test_gzip_stream_split_into_small_chunks(self):
+        body = gzip.compress(json_lines(AUTHORS))
+        client = FakeClient(body, chunk_size=4)
+
+        self.assertEqual(list(stream_authors(client, 'https://example.org/part_000.gz')), AUTHORS)
+
+    def test_concatenated_gzip_members(self):
+        body = gzip.compress(json_lines(AUTHORS[:2])) + gzip.compress(json_lines(AUTHORS[2:]))
+        client = FakeClient(body, chunk_size=7)
+
+        self.assertEqual(list(stream_authors(client, 'https://example.org/part_001.gz')), AUTHORS)
+
+
+if __name__ == '__main__':
+    unittest.main()